@@ -65,6 +65,13 @@ class EnhancedParameterWorkflow:
         
         logger.info(f"Enhanced workflow initialized with {len(self.phase_definitions)} phases")
     
+    @staticmethod
+    def _field_examples(param_model: Type[BaseModel], field_name: str, field_info: Any) -> List[Any]:
+        """Example inputs for a field, preferring the model's get_examples()"""
+        if hasattr(param_model, 'get_examples'):
+            return param_model.get_examples(field_name)
+        return getattr(field_info, 'examples', None) or []
+    
     def _extract_parameters_with_fallback(self, message: str, phase_name: str) -> Dict[str, Any]:
         """
         Fallback parameter extraction using regular LLM when structured output fails.
@@ -85,7 +92,7 @@ class EnhancedParameterWorkflow:
         field_descriptions = []
         for field_name, field_info in param_model.model_fields.items():
             description = field_info.description or f"extract the {field_name.replace('_', ' ')}"
-            examples = getattr(field_info, 'examples', [])
+            examples = self._field_examples(param_model, field_name, field_info)
             example_text = f" Examples: {examples}" if examples else ""
             field_descriptions.append(f"- {field_name}: {description}{example_text}")
         
@@ -167,7 +174,7 @@ class EnhancedParameterWorkflow:
         field_descriptions = []
         for field_name, field_info in param_model.model_fields.items():
             description = field_info.description or f"extract the {field_name.replace('_', ' ')}"
-            examples = getattr(field_info, 'examples', [])
+            examples = self._field_examples(param_model, field_name, field_info)
             example_text = f" Examples: {examples}" if examples else ""
             field_descriptions.append(f"- {field_name}: {description}{example_text}")
         
@@ -300,7 +307,7 @@ class EnhancedParameterWorkflow:
                     continue
                     
                 description = field_info.description or f"the {param.replace('_', ' ')}"
-                examples = getattr(field_info, 'examples', [])
+                examples = self._field_examples(param_model, param, field_info)
                 example_text = f" (e.g., {', '.join(map(str, examples[:3]))})" if examples else ""
                 param_requests.append(f"• **{param.replace('_', ' ').title()}**: {description}{example_text}")
         
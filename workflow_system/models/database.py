@@ -10,7 +10,7 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseField:
     """Represents a field ready for database insertion"""
     column_name: str
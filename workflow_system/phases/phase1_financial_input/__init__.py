@@ -9,7 +9,10 @@ from .parameters import FinancialInputValidationParams
 # Import enhanced implementation with database integration
 from .implementation import (
     financial_input_validation_workflow,
-    Phase1WorkflowProcessor
+    financial_input_validation_batch,
+    Phase1WorkflowProcessor,
+    Phase1ValidationResult,
+    ValidationSummary
 )
 
 # Import enhanced definition
@@ -33,7 +36,8 @@ from .constants import (
 # Import database models
 from .database_models import (
     FinancialInputValidationRecord,
-    DATABASE_SCHEMA
+    DATABASE_SCHEMA,
+    CREATE_TABLE_SQL
 )
 
 # Import field calculators
@@ -51,14 +55,19 @@ from .validation_rules import (
 # Import calculations (enhanced)
 from .calculations import (
     calculate_phase1_completion_score,
-    assess_data_readiness
+    ReadinessResult,
+    assess_data_readiness,
+    assess_data_readiness_batch
 )
 
 __all__ = [
     # Core phase components
     "FinancialInputValidationParams",
     "financial_input_validation_workflow", 
+    "financial_input_validation_batch",
     "Phase1WorkflowProcessor",
+    "Phase1ValidationResult",
+    "ValidationSummary",
     "PHASE1_DEFINITION",
     
     # Constants and enums
@@ -77,6 +86,7 @@ __all__ = [
     # Database integration
     "FinancialInputValidationRecord",
     "DATABASE_SCHEMA",
+    "CREATE_TABLE_SQL",
     
     # Processing components
     "Phase1FieldCalculator",
@@ -86,7 +96,9 @@ __all__ = [
     
     # Calculations
     "calculate_phase1_completion_score",
-    "assess_data_readiness"
+    "ReadinessResult",
+    "assess_data_readiness",
+    "assess_data_readiness_batch"
 ]
 
 # Phase metadata
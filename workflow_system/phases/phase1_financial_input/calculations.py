@@ -3,9 +3,13 @@ Enhanced calculations specific to Phase 1: Financial Input Validation
 File: workflow_system/phases/phase1_financial_input/calculations.py (UPDATED)
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import sys
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from decimal import Decimal, ROUND_HALF_UP
-from datetime import date, datetime
+from dataclasses import dataclass, asdict
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from bisect import bisect_right
 
 from workflow_system.utils.calculators import (
     calculate_data_quality_score,
@@ -13,81 +17,224 @@ from workflow_system.utils.calculators import (
     calculate_term_years_from_dates,
     calculate_term_years_from_years_months,
     calculate_term_years_from_ages,
-    calculate_surrender_penalty,
-    calculate_comprehensive_projection
+    calculate_surrender_penalty
 )
 from .constants import (
     CORE_REQUIRED_FIELDS, 
     PENSION_PRODUCTS, 
-    ISA_PRODUCTS,
     INVESTMENT_PRODUCTS,
     TAX_EXEMPT_PRODUCTS,
+    PRODUCT_CATEGORY,
     SystemLimits,
     DEFAULT_GROWTH_RATES,
     TAX_RATES
 )
 
 
-def calculate_phase1_completion_score(processed_data: Dict[str, Any]) -> int:
-    """Enhanced completion score calculation specific to Phase 1 requirements"""
+# Values treated as "not provided" once normalised
+_MISSING_SENTINELS = frozenset(("", "not specified", "none", "null"))
+_MAX_SENTINEL_LEN = max(map(len, _MISSING_SENTINELS))
+
+# Field groups used by the readiness checks (never mutated)
+_PHASE1_CORE_FIELDS = (
+    'valuation_date',
+    'current_fund_value',
+    'annual_contribution',
+    'product_type',
+    'provider_name',
+    'investment_term_type'
+)
+_PENSION_EXTRA_FIELDS = ('current_age', 'include_taxation', 'tax_band')
+_INVESTMENT_EXTRA_FIELDS = ('include_taxation', 'tax_band')
+_AGE_TERM_FIELDS = ('current_age', 'target_age')
+
+# Core fields walked once by assess_data_readiness:
+# (field, is required core field, is Phase 1 scoring field)
+_READINESS_CORE_SCAN = tuple(
+    (field, field in CORE_REQUIRED_FIELDS, field in _PHASE1_CORE_FIELDS)
+    for field in dict.fromkeys((*CORE_REQUIRED_FIELDS, *_PHASE1_CORE_FIELDS))
+)
+
+# Currency formatting characters stripped before Decimal conversion
+_CCY_TABLE = str.maketrans('', '', '£, ')
+
+# Phase 1 projection assumptions
+_PROJECTION_INFLATION_RATE = Decimal('0.025')  # 2.5% inflation assumption
+_PROJECTION_WITHDRAWAL_RATE = Decimal('0.04')  # 4% rule for income potential
+_PENNY = Decimal('0.01')
+_DEFAULT_TAX_RATE = Decimal('0.2')  # basic rate, used for unknown tax bands
+
+# Age brackets for calculate_age_based_recommendations: under 30, 30-39,
+# 40-49, 50-59 and 60+ (indexed by bisect_right on the thresholds)
+_AGE_THRESHOLDS = (30, 40, 50, 60)
+_AGE_RECOMMENDATIONS = (
+    ("Consider higher-risk growth investments for long-term wealth building",
+     "Take advantage of compound growth over extended timeframe"),
+    ("Balance growth and stability in investment approach",
+     "Consider increasing contributions as income grows"),
+    ("Begin shifting towards more balanced investment strategy",
+     "Review retirement planning regularly"),
+    ("Consider more conservative investment approach",
+     "Plan for potential early retirement options"),
+    ("Focus on capital preservation and income generation",
+     "Consider annuity options for guaranteed income"),
+)
+
+# Tax-band messages for calculate_tax_efficiency_analysis, formatted once per
+# band; the None entry covers unknown bands, which fall back to 20%
+_TAX_MESSAGE_RATES = {**TAX_RATES, None: _DEFAULT_TAX_RATE}
+_TAX_RELIEF_MSG = {
+    band: f"Tax relief at {rate * 100:.0f}% on contributions"
+    for band, rate in _TAX_MESSAGE_RATES.items()
+}
+_TAX_ON_GAINS_MSG = {
+    band: f"Tax on gains at {rate * 100:.0f}% rate"
+    for band, rate in _TAX_MESSAGE_RATES.items()
+}
+
+# Readiness summaries that need no formatting
+_SUMMARY_EXCELLENT = "✅ Excellent - All required data collected with high quality"
+_SUMMARY_VERY_GOOD = "✅ Very Good - Ready to proceed with minor optional data missing"
+_SUMMARY_GOOD = "✅ Good - Ready to proceed though some optional information could enhance analysis"
+
+
+@dataclass(slots=True)
+class ReadinessResult:
+    """Result of assess_data_readiness"""
+    core_fields_complete: bool
+    completion_score: int
+    ready_for_next_phase: bool
+    readiness_percentage: float
+    missing_core_fields: List[str]
+    missing_product_specific: List[str]
+    missing_term_specific: List[str]
+    all_missing_fields: List[str]
+    total_missing_count: int
+    analysis_summary: str
     
-    # Define core fields with higher weight for Phase 1
-    phase1_core_fields = [
-        'valuation_date', 
-        'current_fund_value', 
-        'annual_contribution', 
-        'product_type', 
-        'provider_name',
-        'investment_term_type'
-    ]
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for JSON responses"""
+        return asdict(self)
+
+
+def _is_sentinel(value: Any) -> bool:
+    """Check whether a value normalises to one of the missing sentinels"""
+    # Only strings can match; other types are never stringified
+    if not isinstance(value, str):
+        return False
+    text = value.strip()
+    # Anything longer than the longest sentinel can skip the lower() copy
+    return len(text) <= _MAX_SENTINEL_LEN and text.lower() in _MISSING_SENTINELS
+
+
+def _missing(value: Any) -> bool:
+    """Check whether a processed value counts as missing"""
+    return not value or _is_sentinel(value)
+
+
+def _intern(value: Any) -> Any:
+    """Intern plain strings so set/dict lookups can short-circuit on identity"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a currency string or number to Decimal"""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, str):
+        return Decimal(value.translate(_CCY_TABLE))
+    return Decimal(str(value))
+
+
+def _project_growth_only(initial_value: Decimal, annual_rate: Decimal,
+                         inflation_rate: Decimal, years: Decimal) -> Dict[str, Any]:
+    """
+    Closed-form projection when there are no contributions, charges or tax
+    
+    Returns the subset of calculate_comprehensive_projection's result used by
+    Phase 1, computed with two Decimal powers instead of the full projector.
+    """
+    if initial_value <= 0:
+        raise ValueError("Principal must be positive")
+    if years <= 0:
+        raise ValueError("Years must be positive")
     
-    # Use the enhanced calculator with Phase 1 specific core fields
-    return calculate_data_quality_score(processed_data, phase1_core_fields)
+    nominal_value = (initial_value * (1 + annual_rate) ** years).quantize(_PENNY, rounding=ROUND_HALF_UP)
+    real_value = (nominal_value / (1 + inflation_rate) ** years).quantize(_PENNY)
+    annual_income = nominal_value * _PROJECTION_WITHDRAWAL_RATE
+    
+    return {
+        'projection_summary': {
+            'nominal_future_value': nominal_value,
+            'real_future_value': real_value,
+            'total_growth': nominal_value - initial_value
+        },
+        'income_potential': {
+            'annual_income': annual_income,
+            'monthly_income': annual_income / 12
+        }
+    }
 
 
-def assess_data_readiness(processed_data: Dict[str, Any]) -> Dict[str, Any]:
+def calculate_phase1_completion_score(processed_data: Dict[str, Any],
+                                      missing_core: Optional[List[str]] = None) -> int:
+    """
+    Enhanced completion score calculation specific to Phase 1 requirements
+    
+    Args:
+        processed_data: Processed Phase 1 values
+        missing_core: Phase 1 core fields already known to be missing; when
+            given, the core fields are not scanned again
+    """
+    
+    if missing_core is None:
+        # Use the enhanced calculator with Phase 1 specific core fields
+        return calculate_data_quality_score(processed_data, _PHASE1_CORE_FIELDS)
+    
+    return calculate_data_quality_score(
+        processed_data,
+        _PHASE1_CORE_FIELDS,
+        core_completed=len(_PHASE1_CORE_FIELDS) - len(missing_core)
+    )
+
+
+def assess_data_readiness(processed_data: Dict[str, Any]) -> ReadinessResult:
     """Enhanced data readiness assessment with comprehensive analysis"""
     
     # Core fields that are absolutely required
-    core_fields = CORE_REQUIRED_FIELDS.copy()
+    core_fields = CORE_REQUIRED_FIELDS
     
-    # Check core field completion
-    core_complete = all(
-        processed_data.get(field) and 
-        str(processed_data.get(field, "")).strip().lower() not in ["", "not specified", "none", "null"]
-        for field in core_fields
-    )
+    # Single pass over the core fields: required-field completion and the
+    # Phase 1 scoring fields are checked from the same value lookup
+    missing_core_fields = []
+    missing_scoring_fields = []
+    for field, is_required, is_scored in _READINESS_CORE_SCAN:
+        value = processed_data.get(field)
+        blank = value is None or _is_sentinel(value)
+        if is_required and (blank or not value):
+            missing_core_fields.append(field)
+        if is_scored and blank:
+            missing_scoring_fields.append(field)
+    core_complete = not missing_core_fields
     
     # Calculate completion score
-    completion_score = calculate_phase1_completion_score(processed_data)
-    
-    # Identify missing core fields
-    missing_core_fields = [
-        field for field in core_fields 
-        if not processed_data.get(field) or
-        str(processed_data.get(field, "")).strip().lower() in ["", "not specified", "none", "null"]
-    ]
+    completion_score = calculate_phase1_completion_score(processed_data, missing_scoring_fields)
     
     # Product-specific field validation
-    product_type = processed_data.get('product_type')
+    product_type = _intern(processed_data.get('product_type'))
     product_specific_missing = []
     
     if product_type:
         if product_type in PENSION_PRODUCTS:
-            pension_fields = ['current_age', 'include_taxation', 'tax_band']
-            product_specific_missing.extend([
-                field for field in pension_fields
-                if not processed_data.get(field) or
-                str(processed_data.get(field, "")).strip().lower() in ["", "not specified", "none", "null"]
-            ])
-        
+            product_fields = _PENSION_EXTRA_FIELDS
         elif product_type in INVESTMENT_PRODUCTS:
-            investment_fields = ['include_taxation', 'tax_band']
-            product_specific_missing.extend([
-                field for field in investment_fields
-                if not processed_data.get(field) or
-                str(processed_data.get(field, "")).strip().lower() in ["", "not specified", "none", "null"]
-            ])
+            product_fields = _INVESTMENT_EXTRA_FIELDS
+        else:
+            product_fields = ()
+        
+        for field in product_fields:
+            if _missing(processed_data.get(field)):
+                product_specific_missing.append(field)
     
     # Term-specific field validation
     term_type = processed_data.get('investment_term_type')
@@ -101,15 +248,16 @@ def assess_data_readiness(processed_data: Dict[str, Any]) -> Dict[str, Any]:
             if not processed_data.get('user_input_years'):
                 term_specific_missing.append('user_input_years')
         elif term_type == 'age':
-            age_fields = ['current_age', 'target_age']
-            term_specific_missing.extend([
-                field for field in age_fields
-                if not processed_data.get(field) or
-                str(processed_data.get(field, "")).strip().lower() in ["", "not specified", "none", "null"]
-            ])
+            for field in _AGE_TERM_FIELDS:
+                if _missing(processed_data.get(field)):
+                    term_specific_missing.append(field)
     
     # Overall readiness assessment
-    all_missing = list(set(missing_core_fields + product_specific_missing + term_specific_missing))
+    # current_age can be required by both the product and the term type, so
+    # de-duplicate while keeping the core -> product -> term order
+    all_missing = list(dict.fromkeys(
+        [*missing_core_fields, *product_specific_missing, *term_specific_missing]
+    ))
     is_ready = len(all_missing) == 0
     
     # Calculate readiness percentage
@@ -117,18 +265,29 @@ def assess_data_readiness(processed_data: Dict[str, Any]) -> Dict[str, Any]:
     missing_count = len(all_missing)
     readiness_percentage = max(0, ((total_required_fields - missing_count) / max(1, total_required_fields)) * 100)
     
-    return {
-        "core_fields_complete": core_complete,
-        "completion_score": completion_score,
-        "ready_for_next_phase": is_ready,
-        "readiness_percentage": round(readiness_percentage, 1),
-        "missing_core_fields": missing_core_fields,
-        "missing_product_specific": product_specific_missing,
-        "missing_term_specific": term_specific_missing,
-        "all_missing_fields": all_missing,
-        "total_missing_count": len(all_missing),
-        "analysis_summary": _generate_readiness_summary(is_ready, completion_score, all_missing)
-    }
+    return ReadinessResult(
+        core_fields_complete=core_complete,
+        completion_score=completion_score,
+        ready_for_next_phase=is_ready,
+        readiness_percentage=round(readiness_percentage, 1),
+        missing_core_fields=missing_core_fields,
+        missing_product_specific=product_specific_missing,
+        missing_term_specific=term_specific_missing,
+        all_missing_fields=all_missing,
+        total_missing_count=len(all_missing),
+        analysis_summary=_generate_readiness_summary(is_ready, completion_score, all_missing)
+    )
+
+
+def assess_data_readiness_batch(rows: List[Dict[str, Any]]) -> List[ReadinessResult]:
+    """
+    Assess readiness for many processed Phase 1 records (e.g. a CSV import)
+    
+    Returns one ReadinessResult (as from assess_data_readiness) per row,
+    in input order.
+    """
+    assess = assess_data_readiness
+    return [assess(row) for row in rows]
 
 
 def calculate_investment_projection(processed_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -138,7 +297,7 @@ def calculate_investment_projection(processed_data: Dict[str, Any]) -> Dict[str,
         # Extract required values
         initial_value = processed_data.get('initial_investment_value') or processed_data.get('fund_value')
         term_years = processed_data.get('term_years')
-        product_type = processed_data.get('product_type')
+        product_type = _intern(processed_data.get('product_type'))
         
         if not all([initial_value, term_years, product_type]):
             return {
@@ -147,36 +306,26 @@ def calculate_investment_projection(processed_data: Dict[str, Any]) -> Dict[str,
             }
         
         # Convert to Decimal for precision
-        if isinstance(initial_value, str):
-            initial_value = Decimal(initial_value.replace('£', '').replace(',', ''))
-        elif isinstance(initial_value, (int, float)):
-            initial_value = Decimal(str(initial_value))
+        initial_value = _to_decimal(initial_value)
         
         if isinstance(term_years, (int, float, str)):
             term_years = Decimal(str(term_years))
         
         # Determine appropriate growth rate based on product type
-        if product_type in PENSION_PRODUCTS:
+        category = PRODUCT_CATEGORY.get(product_type, 'other')
+        if category == 'pension':
             growth_rate = DEFAULT_GROWTH_RATES['moderate']  # 5% for pensions
-        elif product_type in ISA_PRODUCTS:
+        elif category == 'isa':
             growth_rate = DEFAULT_GROWTH_RATES['moderate']  # 5% for ISAs
-        elif product_type in INVESTMENT_PRODUCTS:
+        elif category == 'investment':
             growth_rate = DEFAULT_GROWTH_RATES['growth']    # 8% for investments
         else:
             growth_rate = DEFAULT_GROWTH_RATES['conservative']  # 2% for others
         
-        # Calculate basic projection (no contributions assumed for simplicity)
-        annual_contribution = Decimal('0')  # Phase 1 doesn't collect contributions
-        
-        # Use comprehensive projection calculator
-        projection = calculate_comprehensive_projection(
-            initial_value=initial_value,
-            annual_contribution=annual_contribution,
-            annual_rate=growth_rate,
-            annual_charges=Decimal('0'),  # No charges assumed
-            tax_rate=Decimal('0'),        # Tax will be handled in later phases
-            inflation_rate=Decimal('0.025'),  # 2.5% inflation assumption
-            years=term_years
+        # Phase 1 collects no contributions, charges or tax (tax is handled
+        # in later phases), so this is pure compound growth
+        projection = _project_growth_only(
+            initial_value, growth_rate, _PROJECTION_INFLATION_RATE, term_years
         )
         
         return {
@@ -212,10 +361,8 @@ def calculate_surrender_penalty_analysis(processed_data: Dict[str, Any]) -> Dict
             }
         
         # Convert to Decimal
-        if isinstance(fund_value, str):
-            fund_value = Decimal(fund_value.replace('£', '').replace(',', ''))
-        if isinstance(surrender_value, str):
-            surrender_value = Decimal(surrender_value.replace('£', '').replace(',', ''))
+        fund_value = _to_decimal(fund_value)
+        surrender_value = _to_decimal(surrender_value)
         
         # Calculate penalty analysis
         penalty_analysis = calculate_surrender_penalty(fund_value, surrender_value)
@@ -279,25 +426,7 @@ def calculate_age_based_recommendations(processed_data: Dict[str, Any]) -> Dict[
         warnings = []
         
         # Age-specific recommendations
-        if current_age < 30:
-            recommendations.append("Consider higher-risk growth investments for long-term wealth building")
-            recommendations.append("Take advantage of compound growth over extended timeframe")
-            
-        elif current_age < 40:
-            recommendations.append("Balance growth and stability in investment approach")
-            recommendations.append("Consider increasing contributions as income grows")
-            
-        elif current_age < 50:
-            recommendations.append("Begin shifting towards more balanced investment strategy")
-            recommendations.append("Review retirement planning regularly")
-            
-        elif current_age < 60:
-            recommendations.append("Consider more conservative investment approach")
-            recommendations.append("Plan for potential early retirement options")
-            
-        else:
-            recommendations.append("Focus on capital preservation and income generation")
-            recommendations.append("Consider annuity options for guaranteed income")
+        recommendations.extend(_AGE_RECOMMENDATIONS[bisect_right(_AGE_THRESHOLDS, current_age)])
         
         # Product-specific recommendations
         if product_type in PENSION_PRODUCTS:
@@ -344,9 +473,9 @@ def calculate_tax_efficiency_analysis(processed_data: Dict[str, Any]) -> Dict[st
     """Analyze tax efficiency based on product type and client tax situation"""
     
     try:
-        product_type = processed_data.get('product_type')
+        product_type = _intern(processed_data.get('product_type'))
         include_taxation = processed_data.get('include_taxation')
-        tax_band = processed_data.get('tax_band')
+        tax_band = _intern(processed_data.get('tax_band'))
         fund_value = processed_data.get('fund_value')
         
         if not product_type:
@@ -355,39 +484,38 @@ def calculate_tax_efficiency_analysis(processed_data: Dict[str, Any]) -> Dict[st
                 "reason": "Product type required"
             }
         
+        category = PRODUCT_CATEGORY.get(product_type, 'other')
+        is_tax_exempt = product_type in TAX_EXEMPT_PRODUCTS
+        
         analysis = {
             "analysis_available": True,
             "product_type": product_type,
-            "is_tax_exempt": product_type in TAX_EXEMPT_PRODUCTS,
+            "is_tax_exempt": is_tax_exempt,
             "recommendations": [],
             "tax_benefits": [],
             "considerations": []
         }
         
         # Tax-exempt products (ISAs)
-        if product_type in TAX_EXEMPT_PRODUCTS:
+        if is_tax_exempt:
             analysis["tax_benefits"].append("Tax-free growth on investments")
             analysis["tax_benefits"].append("Tax-free withdrawals at any time")
             analysis["recommendations"].append("Maximize annual ISA allowance")
             analysis["considerations"].append("No tax relief on contributions")
         
         # Pension products
-        elif product_type in PENSION_PRODUCTS:
+        elif category == 'pension':
             analysis["tax_benefits"].append("Tax relief on contributions")
             analysis["tax_benefits"].append("Tax-free growth within pension")
             analysis["tax_benefits"].append("25% tax-free lump sum on retirement")
             
             if tax_band and include_taxation:
-                tax_rate = TAX_RATES.get(tax_band, Decimal('0.2'))
-                relief_rate = tax_rate * 100
-                analysis["tax_benefits"].append(f"Tax relief at {relief_rate:.0f}% on contributions")
+                tax_rate = TAX_RATES.get(tax_band, _DEFAULT_TAX_RATE)
+                analysis["tax_benefits"].append(_TAX_RELIEF_MSG.get(tax_band, _TAX_RELIEF_MSG[None]))
                 
                 # Calculate potential annual tax relief
                 if fund_value:
-                    if isinstance(fund_value, str):
-                        fund_val = Decimal(fund_value.replace('£', '').replace(',', ''))
-                    else:
-                        fund_val = Decimal(str(fund_value))
+                    fund_val = _to_decimal(fund_value)
                     
                     # Assume 10% annual contribution for illustration
                     annual_contribution = fund_val * Decimal('0.1')
@@ -398,14 +526,13 @@ def calculate_tax_efficiency_analysis(processed_data: Dict[str, Any]) -> Dict[st
             analysis["considerations"].append("Minimum access age of 55 (rising to 57 in 2028)")
         
         # Investment products
-        elif product_type in INVESTMENT_PRODUCTS:
+        elif category == 'investment':
             analysis["considerations"].append("Liable for income tax on distributions")
             analysis["considerations"].append("Capital gains tax may apply on disposals")
             analysis["recommendations"].append("Consider ISA wrapper for tax efficiency")
             
             if tax_band:
-                tax_rate = TAX_RATES.get(tax_band, Decimal('0.2'))
-                analysis["considerations"].append(f"Tax on gains at {tax_rate * 100:.0f}% rate")
+                analysis["considerations"].append(_TAX_ON_GAINS_MSG.get(tax_band, _TAX_ON_GAINS_MSG[None]))
         
         # General recommendations based on tax band
         if tax_band == 'additional_rate_45':
@@ -427,49 +554,98 @@ def calculate_tax_efficiency_analysis(processed_data: Dict[str, Any]) -> Dict[st
         }
 
 
+def _memoize_analysis(analysis: Callable[[Dict[str, Any]], Dict[str, Any]],
+                      inputs: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Cache a sub-analysis on the values of the fields it actually reads
+    
+    Values are keyed together with their type so that e.g. 1 and Decimal('1')
+    do not share an entry. Unhashable inputs bypass the cache. Top-level lists
+    are copied on the way out so callers cannot mutate the cached result.
+    """
+    
+    @lru_cache(maxsize=256)
+    def cached(key: Tuple[Tuple[type, Any], ...]) -> Dict[str, Any]:
+        return analysis({field: value for field, (_, value) in zip(inputs, key)})
+    
+    def run(processed_data: Dict[str, Any]) -> Dict[str, Any]:
+        key = tuple((type(value), value) for value in map(processed_data.get, inputs))
+        try:
+            result = cached(key)
+        except TypeError:
+            return analysis(processed_data)
+        return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+    
+    run.cache_clear = cached.cache_clear
+    return run
+
+
+# Sub-analyses keyed on their input fields; readiness reads every field so it
+# is always recomputed
+_cached_investment_projection = _memoize_analysis(
+    calculate_investment_projection,
+    ('initial_investment_value', 'fund_value', 'term_years', 'product_type')
+)
+_cached_surrender_penalty_analysis = _memoize_analysis(
+    calculate_surrender_penalty_analysis,
+    ('fund_value', 'surrender_value')
+)
+_cached_age_based_recommendations = _memoize_analysis(
+    calculate_age_based_recommendations,
+    ('current_age', 'target_age', 'product_type')
+)
+_cached_tax_efficiency_analysis = _memoize_analysis(
+    calculate_tax_efficiency_analysis,
+    ('product_type', 'include_taxation', 'tax_band', 'fund_value')
+)
+
+
 def generate_comprehensive_analysis(processed_data: Dict[str, Any]) -> Dict[str, Any]:
     """Generate comprehensive analysis combining all Phase 1 calculations"""
     
+    readiness = assess_data_readiness(processed_data)
+    analyses = (
+        _cached_investment_projection(processed_data),
+        _cached_surrender_penalty_analysis(processed_data),
+        _cached_age_based_recommendations(processed_data),
+        _cached_tax_efficiency_analysis(processed_data)
+    )
     comprehensive_analysis = {
-        "analysis_timestamp": datetime.utcnow().isoformat(),
-        "data_readiness": assess_data_readiness(processed_data),
-        "investment_projection": calculate_investment_projection(processed_data),
-        "surrender_penalty_analysis": calculate_surrender_penalty_analysis(processed_data),
-        "age_based_recommendations": calculate_age_based_recommendations(processed_data),
-        "tax_efficiency_analysis": calculate_tax_efficiency_analysis(processed_data)
+        "analysis_timestamp": datetime.now(timezone.utc).isoformat(),
+        "data_readiness": readiness.to_dict(),
+        "investment_projection": analyses[0],
+        "surrender_penalty_analysis": analyses[1],
+        "age_based_recommendations": analyses[2],
+        "tax_efficiency_analysis": analyses[3]
     }
     
     # Generate overall summary
-    readiness = comprehensive_analysis["data_readiness"]
     
     summary = {
-        "overall_score": readiness["completion_score"],
-        "ready_for_next_phase": readiness["ready_for_next_phase"],
+        "overall_score": readiness.completion_score,
+        "ready_for_next_phase": readiness.ready_for_next_phase,
         "total_recommendations": 0,
         "total_warnings": 0,
         "key_insights": []
     }
     
-    # Count recommendations and warnings
-    for analysis_type, analysis_data in comprehensive_analysis.items():
-        if isinstance(analysis_data, dict):
-            if "recommendations" in analysis_data:
-                summary["total_recommendations"] += len(analysis_data["recommendations"])
-            if "warnings" in analysis_data:
-                summary["total_warnings"] += len(analysis_data["warnings"])
+    # Count recommendations and warnings (readiness carries neither)
+    for analysis_data in analyses:
+        summary["total_recommendations"] += len(analysis_data.get("recommendations", ()))
+        summary["total_warnings"] += len(analysis_data.get("warnings", ()))
     
     # Generate key insights
     product_type = processed_data.get('product_type')
     if product_type:
         if product_type in TAX_EXEMPT_PRODUCTS:
             summary["key_insights"].append("Tax-efficient ISA wrapper provides flexibility")
-        elif product_type in PENSION_PRODUCTS:
+        elif PRODUCT_CATEGORY.get(product_type) == 'pension':
             summary["key_insights"].append("Pension provides tax relief but less flexibility")
         
-        if readiness["ready_for_next_phase"]:
+        if readiness.ready_for_next_phase:
             summary["key_insights"].append("All required data collected - ready for detailed analysis")
         else:
-            missing_count = readiness["total_missing_count"]
+            missing_count = readiness.total_missing_count
             summary["key_insights"].append(f"{missing_count} additional fields needed for complete analysis")
     
     comprehensive_analysis["summary"] = summary
@@ -482,11 +658,11 @@ def _generate_readiness_summary(is_ready: bool, completion_score: int, missing_f
     
     if is_ready:
         if completion_score >= 95:
-            return "✅ Excellent - All required data collected with high quality"
+            return _SUMMARY_EXCELLENT
         elif completion_score >= 85:
-            return "✅ Very Good - Ready to proceed with minor optional data missing"
+            return _SUMMARY_VERY_GOOD
         else:
-            return "✅ Good - Ready to proceed though some optional information could enhance analysis"
+            return _SUMMARY_GOOD
     else:
         missing_count = len(missing_fields)
         if missing_count == 1:
@@ -92,24 +92,24 @@ TAX_RATES: Dict[str, Decimal] = {
 }
 
 # Product Type Categories for validation
-PENSION_PRODUCTS = {
+PENSION_PRODUCTS = frozenset({
     ProductType.PENSION.value,
     ProductType.SIPP.value
-}
+})
 
-ISA_PRODUCTS = {
+ISA_PRODUCTS = frozenset({
     ProductType.ISA.value,
     ProductType.STOCKS_SHARES_ISA.value
-}
+})
 
-INVESTMENT_PRODUCTS = {
+INVESTMENT_PRODUCTS = frozenset({
     ProductType.INVESTMENT_BOND.value,
     ProductType.UNIT_TRUST.value,
     ProductType.OEIC.value,
     ProductType.INVESTMENT_TRUST.value
-}
+})
 
-INSURANCE_PRODUCTS = {
+INSURANCE_PRODUCTS = frozenset({
     ProductType.LIFE_INSURANCE.value,
     ProductType.ENDOWMENT.value,
     ProductType.WHOLE_OF_LIFE.value,
@@ -117,7 +117,7 @@ INSURANCE_PRODUCTS = {
     ProductType.CRITICAL_ILLNESS_COVER.value,
     ProductType.INCOME_PROTECTION.value,
     ProductType.HEALTH_INSURANCE.value
-}
+})
 
 # Tax exempt products (no tax analysis needed)
 TAX_EXEMPT_PRODUCTS = ISA_PRODUCTS
@@ -125,6 +125,15 @@ TAX_EXEMPT_PRODUCTS = ISA_PRODUCTS
 # Products requiring age validation
 AGE_SENSITIVE_PRODUCTS = PENSION_PRODUCTS | INSURANCE_PRODUCTS
 
+# Product type value -> category, resolved with a single lookup
+# (categories match the REQUIRED_FIELDS_BY_PRODUCT keys)
+PRODUCT_CATEGORY: Dict[str, str] = {
+    **{product: 'pension' for product in PENSION_PRODUCTS},
+    **{product: 'isa' for product in ISA_PRODUCTS},
+    **{product: 'investment' for product in INVESTMENT_PRODUCTS},
+    **{product: 'insurance' for product in INSURANCE_PRODUCTS}
+}
+
 # Required fields by product type
 REQUIRED_FIELDS_BY_PRODUCT: Dict[str, list] = {
     'common': [
@@ -3,14 +3,79 @@ Database Models for Phase 1: Core Input Validation
 File: workflow_system/phases/phase1_financial_input/database_models.py
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable
 from workflow_system.models.database import DatabaseField, DatabaseRecord
 
 
-@dataclass
+# Column name and SQL type for every record field written by
+# to_database_record, in insertion order ('id' is added separately)
+_FIELD_SPECS = (
+    ('session_id', 'VARCHAR(100)'),
+    ('created_at', 'TIMESTAMP'),
+    ('updated_at', 'TIMESTAMP'),
+    
+    # Core financial data
+    ('valuation_date', 'DATE'),
+    ('provider_name', 'VARCHAR(255)'),
+    ('product_name', 'VARCHAR(255)'),
+    ('product_type', 'VARCHAR(50)'),
+    ('fund_value', 'DECIMAL(15,2)'),
+    ('surrender_value', 'DECIMAL(15,2)'),
+    
+    # Investment term configuration
+    ('investment_term_type', 'VARCHAR(20)'),
+    ('end_date', 'DATE'),
+    ('user_input_years', 'INTEGER'),
+    ('user_input_months', 'INTEGER'),
+    ('current_age', 'INTEGER'),
+    ('target_age', 'INTEGER'),
+    
+    # Calculated fields
+    ('term_years', 'DECIMAL(10,4)'),
+    ('initial_investment_value', 'DECIMAL(15,2)'),
+    ('analysis_mode', 'VARCHAR(20)'),
+    
+    # Tax configuration
+    ('include_taxation', 'BOOLEAN'),
+    ('tax_band', 'VARCHAR(30)'),
+    ('client_tax_rate', 'DECIMAL(5,4)'),
+    
+    # Analysis metadata
+    ('performing_switch_analysis', 'BOOLEAN'),
+    ('data_quality_score', 'INTEGER'),
+    ('completion_percentage', 'DECIMAL(5,2)'),
+    ('validation_status', 'VARCHAR(20)'),
+    
+    # Error tracking
+    ('missing_fields', 'TEXT'),
+    ('validation_errors', 'TEXT'),
+)
+
+
+def _create_fields_filler(specs) -> Callable[[Any, Dict[str, DatabaseField]], None]:
+    """
+    Compile a function that adds one DatabaseField per (column, SQL type) spec
+    
+    The body is generated once at import time (as dataclasses does for
+    __init__) so each record reads its attributes directly instead of via
+    getattr in a loop.
+    """
+    lines = ["def _fill_fields(self, fields):"]
+    for name, sql_type in specs:
+        lines.append(f"    fields[{name!r}] = DatabaseField({name!r}, self.{name}, {sql_type!r})")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), {"DatabaseField": DatabaseField}, namespace)
+    return namespace["_fill_fields"]
+
+
+_fill_fields = _create_fields_filler(_FIELD_SPECS)
+
+
+@dataclass(slots=True)
 class FinancialInputValidationRecord:
     """Complete database record for Phase 1 financial input validation"""
     
@@ -64,46 +129,16 @@ class FinancialInputValidationRecord:
         # Core identification fields
         if self.id is not None:
             fields['id'] = DatabaseField('id', self.id, 'INTEGER', False, True)
-            
-        fields['session_id'] = DatabaseField('session_id', self.session_id, 'VARCHAR(100)')
-        fields['created_at'] = DatabaseField('created_at', self.created_at or datetime.utcnow(), 'TIMESTAMP')
-        fields['updated_at'] = DatabaseField('updated_at', self.updated_at or datetime.utcnow(), 'TIMESTAMP')
-        
-        # Core financial data
-        fields['valuation_date'] = DatabaseField('valuation_date', self.valuation_date, 'DATE')
-        fields['provider_name'] = DatabaseField('provider_name', self.provider_name, 'VARCHAR(255)')
-        fields['product_name'] = DatabaseField('product_name', self.product_name, 'VARCHAR(255)')
-        fields['product_type'] = DatabaseField('product_type', self.product_type, 'VARCHAR(50)')
-        fields['fund_value'] = DatabaseField('fund_value', self.fund_value, 'DECIMAL(15,2)')
-        fields['surrender_value'] = DatabaseField('surrender_value', self.surrender_value, 'DECIMAL(15,2)')
-        
-        # Investment term configuration
-        fields['investment_term_type'] = DatabaseField('investment_term_type', self.investment_term_type, 'VARCHAR(20)')
-        fields['end_date'] = DatabaseField('end_date', self.end_date, 'DATE')
-        fields['user_input_years'] = DatabaseField('user_input_years', self.user_input_years, 'INTEGER')
-        fields['user_input_months'] = DatabaseField('user_input_months', self.user_input_months, 'INTEGER')
-        fields['current_age'] = DatabaseField('current_age', self.current_age, 'INTEGER')
-        fields['target_age'] = DatabaseField('target_age', self.target_age, 'INTEGER')
         
-        # FIXED: Calculated fields - ensure they're properly set
-        fields['term_years'] = DatabaseField('term_years', self.term_years, 'DECIMAL(10,4)')
-        fields['initial_investment_value'] = DatabaseField('initial_investment_value', self.initial_investment_value, 'DECIMAL(15,2)')
-        fields['analysis_mode'] = DatabaseField('analysis_mode', self.analysis_mode, 'VARCHAR(20)')
+        _fill_fields(self, fields)
         
-        # Tax configuration
-        fields['include_taxation'] = DatabaseField('include_taxation', self.include_taxation, 'BOOLEAN')
-        fields['tax_band'] = DatabaseField('tax_band', self.tax_band, 'VARCHAR(30)')
-        fields['client_tax_rate'] = DatabaseField('client_tax_rate', self.client_tax_rate, 'DECIMAL(5,4)')
-        
-        # Analysis metadata - ENSURE these are populated
-        fields['performing_switch_analysis'] = DatabaseField('performing_switch_analysis', self.performing_switch_analysis, 'BOOLEAN')
-        fields['data_quality_score'] = DatabaseField('data_quality_score', self.data_quality_score, 'INTEGER')
-        fields['completion_percentage'] = DatabaseField('completion_percentage', self.completion_percentage, 'DECIMAL(5,2)')
-        fields['validation_status'] = DatabaseField('validation_status', self.validation_status, 'VARCHAR(20)')
-        
-        # Error tracking
-        fields['missing_fields'] = DatabaseField('missing_fields', self.missing_fields, 'TEXT')
-        fields['validation_errors'] = DatabaseField('validation_errors', self.validation_errors, 'TEXT')
+        # Timestamps default to now when the record has not been stamped yet
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.utcnow()
+            if self.created_at is None:
+                fields['created_at'].value = now
+            if self.updated_at is None:
+                fields['updated_at'].value = now
         
         return DatabaseRecord(
             table_name="financial_input_validation",
@@ -114,35 +149,40 @@ class FinancialInputValidationRecord:
                 "record_type": "FinancialInputValidationRecord",
                 "schema_version": "1.0",
                 "total_fields": len(fields),
-                "non_null_fields": len([f for f in fields.values() if f.value is not None])
+                "non_null_fields": sum(1 for f in fields.values() if f.value is not None)
             }
         )
     
     @classmethod
     def from_params(cls, params: Dict[str, Any], session_id: Optional[str] = None) -> 'FinancialInputValidationRecord':
         """Create record from parameter dictionary"""
-        return cls(
-            session_id=session_id,
-            valuation_date=params.get('valuation_date'),
-            provider_name=params.get('provider_name'),
-            product_name=params.get('product_name'),
-            product_type=params.get('product_type'),
-            fund_value=params.get('fund_value'),
-            surrender_value=params.get('surrender_value'),
-            investment_term_type=params.get('investment_term_type'),
-            end_date=params.get('end_date'),
-            user_input_years=params.get('user_input_years'),
-            user_input_months=params.get('user_input_months'),
-            current_age=params.get('current_age'),
-            target_age=params.get('target_age'),
-            include_taxation=params.get('include_taxation'),
-            tax_band=params.get('tax_band'),
-            performing_switch_analysis=params.get('performing_switch_analysis')
-        )
+        # Every field defaults to None, so bypass the generated __init__ and
+        # fill the slots directly
+        record = cls.__new__(cls)
+        record.session_id = session_id
+        for name in _FROM_PARAM_FIELDS:
+            setattr(record, name, params.get(name))
+        for name in _UNSET_RECORD_FIELDS:
+            setattr(record, name, None)
+        return record
+
+
+# User-provided fields copied 1:1 by FinancialInputValidationRecord.from_params
+_FROM_PARAM_FIELDS = (
+    'valuation_date', 'provider_name', 'product_name', 'product_type',
+    'fund_value', 'surrender_value', 'investment_term_type', 'end_date',
+    'user_input_years', 'user_input_months', 'current_age', 'target_age',
+    'include_taxation', 'tax_band', 'performing_switch_analysis'
+)
+# Remaining record fields, left as None by from_params
+_UNSET_RECORD_FIELDS = tuple(
+    f.name for f in dataclass_fields(FinancialInputValidationRecord)
+    if f.name != 'session_id' and f.name not in _FROM_PARAM_FIELDS
+)
 
 
 # Database schema definition for reference
-DATABASE_SCHEMA = {
+_DATABASE_SCHEMA = {
     "financial_input_validation": {
         "columns": {
             "id": "INTEGER PRIMARY KEY AUTO_INCREMENT",
@@ -200,4 +240,31 @@ DATABASE_SCHEMA = {
             "CHECK (data_quality_score >= 0 AND data_quality_score <= 100)"
         ]
     }
-}
\ No newline at end of file
+}
+
+
+def _freeze_table(table: Dict[str, Any]) -> MappingProxyType:
+    """Read-only view of one table definition (columns mapping, tuple lists)"""
+    return MappingProxyType({
+        "columns": MappingProxyType(table["columns"]),
+        "indexes": tuple(table["indexes"]),
+        "constraints": tuple(table["constraints"])
+    })
+
+
+def _create_table_sql(table_name: str, table: Dict[str, Any]) -> str:
+    """Build the CREATE TABLE statement for one table definition"""
+    definitions = [f"{column} {spec}" for column, spec in table["columns"].items()]
+    definitions.extend(table["indexes"])
+    definitions.extend(table["constraints"])
+    return f"CREATE TABLE {table_name} (\n  " + ",\n  ".join(definitions) + "\n);"
+
+
+DATABASE_SCHEMA = MappingProxyType({
+    table_name: _freeze_table(table) for table_name, table in _DATABASE_SCHEMA.items()
+})
+
+# DDL for the Phase 1 table, built once at import
+CREATE_TABLE_SQL = _create_table_sql(
+    "financial_input_validation", _DATABASE_SCHEMA["financial_input_validation"]
+)
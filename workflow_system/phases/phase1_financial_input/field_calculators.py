@@ -5,16 +5,132 @@ File: workflow_system/phases/phase1_financial_input/field_calculators.py
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import json
+import re
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json produces the same output
+    orjson = None
 
 from workflow_system.phases.phase1_financial_input.constants import (
     InvestmentTermType, TaxBand, AnalysisMode, TAX_RATES,
     PENSION_PRODUCTS, ISA_PRODUCTS, INVESTMENT_PRODUCTS, 
-    TAX_EXEMPT_PRODUCTS, SystemLimits
+    TAX_EXEMPT_PRODUCTS, SystemLimits, CORE_REQUIRED_FIELDS
 )
 
 
+_CORE_REQUIRED_SET = frozenset(CORE_REQUIRED_FIELDS)
+
+# Decimal constants used by the calculators
+_ZERO = Decimal('0')
+_CENTS = Decimal('0.01')
+_ONE_TENTH = Decimal('0.1')
+_HUNDRED = Decimal(100)
+_DAYS_PER_YEAR = Decimal('365.25')
+_MONTHS_PER_YEAR = Decimal(12)
+_HIGH_SURRENDER_RATIO = Decimal('1.2')
+_LOW_SURRENDER_RATIO = Decimal('0.5')
+
+# String values treated as "not provided" once normalised
+_MISSING_STRS = frozenset(('', 'none', 'not specified', 'null'))
+
+# Intent keywords for performing_switch_analysis auto-detection. The
+# patterns match inside a lookahead so every (possibly overlapping)
+# substring occurrence is found in one pass; scores count distinct keywords.
+_SWITCH_KEYWORDS = ('transfer', 'switch', 'move', 'change provider', 'new provider')
+_REMODEL_KEYWORDS = ('optimize', 'rebalance', 'reallocate', 'improve', 'review funds')
+_SWITCH_KEYWORDS_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _SWITCH_KEYWORDS)))
+_REMODEL_KEYWORDS_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _REMODEL_KEYWORDS)))
+
+
+def _dumps_json(value: Any) -> str:
+    """Compact JSON encoding for the database JSON columns"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+# Validation error classification for calculate_validation_status
+_CRITICAL_ERROR_RE = re.compile(r'must be|required|cannot|invalid|missing', re.IGNORECASE)
+_WARNING_ERROR_RE = re.compile(r'tax-exempt|not needed', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ddmmyyyy(value: str) -> date:
+    """Parse a DD/MM/YYYY date string (cached across records)"""
+    return datetime.strptime(value, '%d/%m/%Y').date()
+
+
+def _is_filled(value: Any) -> bool:
+    """Check whether a field value counts as provided"""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() not in _MISSING_STRS
+    return True
+
+
+def _term_years_until(errors: List[str], params: Dict[str, Any]) -> Optional[Decimal]:
+    """term_years for 'until': (end_date - valuation_date) / 365.25"""
+    valuation_date = params.get('valuation_date')
+    end_date = params.get('end_date')
+    if not end_date or not valuation_date:
+        return None
+        
+    # Convert to date objects if they're strings
+    if isinstance(valuation_date, str):
+        valuation_date = _parse_ddmmyyyy(valuation_date)
+    if isinstance(end_date, str):
+        end_date = _parse_ddmmyyyy(end_date)
+        
+    if end_date <= valuation_date:
+        errors.append("End date must be after valuation date")
+        return None
+        
+    days_diff = (end_date - valuation_date).days
+    years = Decimal(days_diff) / _DAYS_PER_YEAR
+    return years.quantize(_CENTS)
+
+
+def _term_years_years(errors: List[str], params: Dict[str, Any]) -> Optional[Decimal]:
+    """term_years for 'years': user_input_years + (user_input_months / 12)"""
+    years = params.get('user_input_years', 0) or 0
+    months = params.get('user_input_months', 0) or 0
+    
+    if years == 0 and months == 0:
+        errors.append("Term must be greater than zero")
+        return None
+        
+    total_years = Decimal(years) + (Decimal(months) / _MONTHS_PER_YEAR)
+    return total_years.quantize(_CENTS)
+
+
+def _term_years_age(errors: List[str], params: Dict[str, Any]) -> Optional[Decimal]:
+    """term_years for 'age': target_age - current_age"""
+    current_age = params.get('current_age')
+    target_age = params.get('target_age')
+    
+    if not current_age or not target_age:
+        return None
+        
+    if target_age <= current_age:
+        errors.append("Target age must be greater than current age")
+        return None
+        
+    return Decimal(target_age - current_age)
+
+
+# investment_term_type value -> term_years calculation
+_TERM_HANDLERS = {
+    InvestmentTermType.UNTIL.value: _term_years_until,
+    InvestmentTermType.YEARS.value: _term_years_years,
+    InvestmentTermType.AGE.value: _term_years_age,
+}
+
+
 class Phase1FieldCalculator:
     """Calculator for Phase 1 computed fields"""
     
@@ -25,9 +141,9 @@ class Phase1FieldCalculator:
         """Clear calculation errors"""
         self.calculation_errors = []
     
-    def get_errors(self) -> List[str]:
+    def get_errors(self) -> Tuple[str, ...]:
         """Get calculation errors"""
-        return self.calculation_errors.copy()
+        return tuple(self.calculation_errors)
     
     def calculate_term_years(self, params: Dict[str, Any]) -> Optional[Decimal]:
         """
@@ -40,53 +156,13 @@ class Phase1FieldCalculator:
         """
         try:
             term_type = params.get('investment_term_type')
-            valuation_date = params.get('valuation_date')
             
             if not term_type:
                 return None
-                
-            if term_type == InvestmentTermType.UNTIL.value:
-                end_date = params.get('end_date')
-                if not end_date or not valuation_date:
-                    return None
-                    
-                # Convert to date objects if they're strings
-                if isinstance(valuation_date, str):
-                    valuation_date = datetime.strptime(valuation_date, '%d/%m/%Y').date()
-                if isinstance(end_date, str):
-                    end_date = datetime.strptime(end_date, '%d/%m/%Y').date()
-                    
-                if end_date <= valuation_date:
-                    self.calculation_errors.append("End date must be after valuation date")
-                    return None
-                    
-                days_diff = (end_date - valuation_date).days
-                years = Decimal(days_diff) / Decimal('365.25')
-                return years.quantize(Decimal('0.01'))
-                
-            elif term_type == InvestmentTermType.YEARS.value:
-                years = params.get('user_input_years', 0) or 0
-                months = params.get('user_input_months', 0) or 0
-                
-                if years == 0 and months == 0:
-                    self.calculation_errors.append("Term must be greater than zero")
-                    return None
-                    
-                total_years = Decimal(years) + (Decimal(months) / 12)
-                return total_years.quantize(Decimal('0.01'))
-                
-            elif term_type == InvestmentTermType.AGE.value:
-                current_age = params.get('current_age')
-                target_age = params.get('target_age')
-                
-                if not current_age or not target_age:
-                    return None
-                    
-                if target_age <= current_age:
-                    self.calculation_errors.append("Target age must be greater than current age")
-                    return None
-                    
-                return Decimal(target_age - current_age)
+            
+            handler = _TERM_HANDLERS.get(term_type)
+            if handler is not None:
+                return handler(self.calculation_errors, params)
                 
         except Exception as e:
             self.calculation_errors.append(f"Error calculating term_years: {str(e)}")
@@ -94,6 +170,18 @@ class Phase1FieldCalculator:
         
         return None
     
+    @staticmethod
+    def _derive_switch_fields(params: Dict[str, Any]) -> Tuple[Optional[Decimal], Optional[str]]:
+        """Derive (initial_investment_value, analysis_mode) from performing_switch_analysis"""
+        performing_switch = params.get('performing_switch_analysis')
+        
+        if performing_switch is True:
+            return params.get('surrender_value'), AnalysisMode.SWITCHING.value
+        if performing_switch is False:
+            return params.get('fund_value'), AnalysisMode.REMODELING.value
+        # Default to fund_value if switch analysis not specified
+        return params.get('fund_value'), None
+    
     def calculate_initial_investment_value(self, params: Dict[str, Any]) -> Optional[Decimal]:
         """
         Calculate initial_investment_value based on performing_switch_analysis
@@ -102,22 +190,7 @@ class Phase1FieldCalculator:
         - If performing_switch_analysis = True: use surrender_value
         - If performing_switch_analysis = False: use fund_value
         """
-        try:
-            performing_switch = params.get('performing_switch_analysis')
-            fund_value = params.get('fund_value')
-            surrender_value = params.get('surrender_value')
-            
-            if performing_switch is True:
-                return surrender_value
-            elif performing_switch is False:
-                return fund_value
-            else:
-                # Default to fund_value if switch analysis not specified
-                return fund_value
-                
-        except Exception as e:
-            self.calculation_errors.append(f"Error calculating initial_investment_value: {str(e)}")
-            return None
+        return self._derive_switch_fields(params)[0]
     
     def calculate_analysis_mode(self, params: Dict[str, Any]) -> Optional[str]:
         """
@@ -127,19 +200,7 @@ class Phase1FieldCalculator:
         - If performing_switch_analysis = True: "switching"
         - If performing_switch_analysis = False: "remodeling"
         """
-        try:
-            performing_switch = params.get('performing_switch_analysis')
-            
-            if performing_switch is True:
-                return AnalysisMode.SWITCHING.value
-            elif performing_switch is False:
-                return AnalysisMode.REMODELING.value
-            else:
-                return None
-                
-        except Exception as e:
-            self.calculation_errors.append(f"Error calculating analysis_mode: {str(e)}")
-            return None
+        return self._derive_switch_fields(params)[1]
     
     def calculate_client_tax_rate(self, params: Dict[str, Any]) -> Optional[Decimal]:
         """
@@ -187,11 +248,8 @@ class Phase1FieldCalculator:
             
             combined_text = ' '.join(str(field).lower() for field in text_fields if field)
             
-            switch_keywords = ['transfer', 'switch', 'move', 'change provider', 'new provider']
-            remodel_keywords = ['optimize', 'rebalance', 'reallocate', 'improve', 'review funds']
-            
-            switch_score = sum(1 for keyword in switch_keywords if keyword in combined_text)
-            remodel_score = sum(1 for keyword in remodel_keywords if keyword in combined_text)
+            switch_score = len(set(_SWITCH_KEYWORDS_RE.findall(combined_text)))
+            remodel_score = len(set(_REMODEL_KEYWORDS_RE.findall(combined_text)))
             
             if switch_score > remodel_score:
                 return True
@@ -217,9 +275,7 @@ class Phase1FieldCalculator:
         for field in required_fields:
             value = params.get(field)
             
-            if value is None:
-                missing.append(field)
-            elif isinstance(value, str) and value.strip().lower() in ['', 'none', 'not specified', 'null']:
+            if not _is_filled(value):
                 missing.append(field)
             elif isinstance(value, (int, float, Decimal)) and value == 0:
                 # For numeric fields, 0 might be considered missing depending on context
@@ -228,6 +284,47 @@ class Phase1FieldCalculator:
                     
         return missing
     
+    def _compute_field_stats(self, params: Dict[str, Any], all_fields: List[str]) -> Tuple[int, int]:
+        """Count completed fields and completed core fields in a single pass"""
+        completed_fields = 0
+        core_completed = 0
+        
+        for field in all_fields:
+            if _is_filled(params.get(field)):
+                completed_fields += 1
+                if field in _CORE_REQUIRED_SET:
+                    core_completed += 1
+        
+        return completed_fields, core_completed
+    
+    @staticmethod
+    def _quality_score_from_stats(all_fields: List[str], completed_fields: int, core_completed: int) -> int:
+        """Weighted data quality score from precomputed completion counts"""
+        total_fields = len(all_fields)
+        if total_fields == 0:
+            return 0
+        
+        # Calculate weighted score
+        core_fields_count = len(_CORE_REQUIRED_SET.intersection(all_fields))
+        if core_fields_count > 0:
+            core_score = (core_completed / core_fields_count) * 70
+            optional_score = (completed_fields / total_fields) * 30
+            total_score = core_score + optional_score
+        else:
+            # Simple percentage if no core fields
+            total_score = (completed_fields / total_fields) * 100
+            
+        return round(total_score)
+    
+    @staticmethod
+    def _completion_percentage_from_stats(all_fields: List[str], completed_fields: int) -> Decimal:
+        """Completion percentage from a precomputed completed-field count"""
+        if not all_fields:
+            return _ZERO
+        
+        percentage = (Decimal(completed_fields) / len(all_fields)) * _HUNDRED
+        return percentage.quantize(_ONE_TENTH)
+    
     def calculate_data_quality_score(self, params: Dict[str, Any], all_fields: List[str]) -> int:
         """
         Calculate data quality score (0-100) based on field completion
@@ -237,39 +334,8 @@ class Phase1FieldCalculator:
         - Optional fields contribute remaining weight (30%)
         """
         try:
-            from workflow_system.phases.phase1_financial_input.constants import CORE_REQUIRED_FIELDS
-            
-            total_fields = len(all_fields)
-            if total_fields == 0:
-                return 0
-                
-            # Count completed fields
-            completed_fields = 0
-            core_completed = 0
-            
-            for field in all_fields:
-                value = params.get(field)
-                is_completed = (
-                    value is not None and 
-                    str(value).strip().lower() not in ['', 'none', 'not specified', 'null']
-                )
-                
-                if is_completed:
-                    completed_fields += 1
-                    if field in CORE_REQUIRED_FIELDS:
-                        core_completed += 1
-            
-            # Calculate weighted score
-            core_fields_count = len([f for f in CORE_REQUIRED_FIELDS if f in all_fields])
-            if core_fields_count > 0:
-                core_score = (core_completed / core_fields_count) * 70
-                optional_score = (completed_fields / total_fields) * 30
-                total_score = core_score + optional_score
-            else:
-                # Simple percentage if no core fields
-                total_score = (completed_fields / total_fields) * 100
-                
-            return round(total_score)
+            completed_fields, core_completed = self._compute_field_stats(params, all_fields)
+            return self._quality_score_from_stats(all_fields, completed_fields, core_completed)
             
         except Exception as e:
             self.calculation_errors.append(f"Error calculating data_quality_score: {str(e)}")
@@ -283,44 +349,23 @@ class Phase1FieldCalculator:
         - Percentage of non-null fields out of total fields
         """
         try:
-            if not all_fields:
-                return Decimal('0')
-                
-            completed = sum(
-                1 for field in all_fields
-                if params.get(field) is not None and 
-                str(params.get(field)).strip().lower() not in ['', 'none', 'not specified', 'null']
-            )
-            
-            percentage = (Decimal(completed) / Decimal(len(all_fields))) * 100
-            return percentage.quantize(Decimal('0.1'))
+            completed_fields, _ = self._compute_field_stats(params, all_fields)
+            return self._completion_percentage_from_stats(all_fields, completed_fields)
             
         except Exception as e:
             self.calculation_errors.append(f"Error calculating completion_percentage: {str(e)}")
-            return Decimal('0')
+            return _ZERO
     
     def calculate_validation_status(self, params: Dict[str, Any], missing_fields: List[str],  validation_errors: List[str]) -> str:
         """Calculate overall validation status with better logic"""
         try:
             # Critical errors = things that prevent completion
-            critical_errors = [
-                error for error in validation_errors
-                if any(keyword in error.lower() for keyword in [
-                    "must be", "required", "cannot", "invalid", "missing"
-                ])
-            ]
-            
-            # Warnings = issues that don't prevent completion
-            warnings = [
-                error for error in validation_errors
-                if "tax-exempt" in error.lower() or "not needed" in error.lower()
-            ]
-            
-            if critical_errors:
+            if any(_CRITICAL_ERROR_RE.search(error) for error in validation_errors):
                 return "failed"
             elif missing_fields:
                 return "pending"
-            elif warnings:
+            # Warnings = issues that don't prevent completion
+            elif any(_WARNING_ERROR_RE.search(error) for error in validation_errors):
                 return "completed_with_warnings"
             else:
                 return "validated"
@@ -339,7 +384,6 @@ class Phase1FieldCalculator:
         self.clear_errors()
         
         if required_fields is None:
-            from workflow_system.phases.phase1_financial_input.constants import CORE_REQUIRED_FIELDS
             required_fields = CORE_REQUIRED_FIELDS
         
         # Get all available field names for scoring
@@ -349,32 +393,55 @@ class Phase1FieldCalculator:
         
         # Calculate derived fields
         calculated['term_years'] = self.calculate_term_years(params)
-        calculated['initial_investment_value'] = self.calculate_initial_investment_value(params)
-        calculated['analysis_mode'] = self.calculate_analysis_mode(params)
+        calculated['initial_investment_value'], calculated['analysis_mode'] = self._derive_switch_fields(params)
         calculated['client_tax_rate'] = self.calculate_client_tax_rate(params)
         calculated['performing_switch_analysis'] = self.calculate_performing_switch_analysis(params)
         
         # Calculate validation fields
         calculated['missing_fields'] = self.calculate_missing_fields(params, required_fields)
-        calculated['data_quality_score'] = self.calculate_data_quality_score(params, all_available_fields)
-        calculated['completion_percentage'] = self.calculate_completion_percentage(params, all_available_fields)
+        
+        # Quality score and completion percentage share one walk over the fields
+        try:
+            completed_fields, core_completed = self._compute_field_stats(params, all_available_fields)
+            calculated['data_quality_score'] = self._quality_score_from_stats(
+                all_available_fields, completed_fields, core_completed
+            )
+            calculated['completion_percentage'] = self._completion_percentage_from_stats(
+                all_available_fields, completed_fields
+            )
+        except Exception as e:
+            self.calculation_errors.append(f"Error calculating field completion: {str(e)}")
+            calculated['data_quality_score'] = 0
+            calculated['completion_percentage'] = _ZERO
+        
         calculated['validation_status'] = self.calculate_validation_status(
-            params, calculated['missing_fields'], self.get_errors()
+            params, calculated['missing_fields'], self.calculation_errors
         )
         
         # Convert missing_fields to JSON string for database storage
         if calculated['missing_fields']:
-            calculated['missing_fields_json'] = json.dumps(calculated['missing_fields'])
+            calculated['missing_fields_json'] = _dumps_json(calculated['missing_fields'])
         else:
             calculated['missing_fields_json'] = None
             
         # Store validation errors as JSON
-        if self.get_errors():
-            calculated['validation_errors'] = json.dumps(self.get_errors())
+        if self.calculation_errors:
+            calculated['validation_errors'] = _dumps_json(self.calculation_errors)
         else:
             calculated['validation_errors'] = None
         
         return calculated
+    
+    def calculate_batch(self, records: List[Dict[str, Any]], required_fields: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Calculate computed fields for many records (bulk import / backfill)
+        
+        Returns:
+        - One calculate_all_fields result per record, in input order; each
+          record's errors are carried in its 'validation_errors' value
+        """
+        calculate = self.calculate_all_fields
+        return [calculate(record, required_fields) for record in records]
 
 
 # Business rule validators
@@ -412,9 +479,9 @@ class BusinessRuleValidator:
         if fund_value and surrender_value:
             ratio = surrender_value / fund_value
             
-            if ratio > Decimal('1.2'):
+            if ratio > _HIGH_SURRENDER_RATIO:
                 errors.append("Surrender value is unusually high compared to fund value - please verify")
-            elif ratio < Decimal('0.5'):
+            elif ratio < _LOW_SURRENDER_RATIO:
                 errors.append("Surrender value is very low compared to fund value - high exit penalties may apply")
                 
         return errors
@@ -446,9 +513,14 @@ class BusinessRuleValidator:
     def validate_all_business_rules(params: Dict[str, Any]) -> List[str]:
         """Run all business rule validations"""
         all_errors = []
+        product_type = params.get('product_type')
+        is_pension = product_type in PENSION_PRODUCTS
         
-        all_errors.extend(BusinessRuleValidator.validate_pension_age_rules(params))
+        # Skip rule groups that cannot fire for this product
+        if is_pension:
+            all_errors.extend(BusinessRuleValidator.validate_pension_age_rules(params))
         all_errors.extend(BusinessRuleValidator.validate_surrender_value_ratio(params))
-        all_errors.extend(BusinessRuleValidator.validate_tax_configuration(params))
+        if is_pension or product_type in TAX_EXEMPT_PRODUCTS or params.get('include_taxation'):
+            all_errors.extend(BusinessRuleValidator.validate_tax_configuration(params))
         
         return all_errors
\ No newline at end of file
@@ -5,7 +5,12 @@ File: workflow_system/phases/phase1_financial_input/implementation.py (UPDATED)
 
 import datetime
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, List, Optional
 from decimal import Decimal
 
 from workflow_system.utils.converters import Phase1DataConverter
@@ -15,12 +20,237 @@ from workflow_system.phases.phase1_financial_input.field_calculators import (
 from workflow_system.phases.phase1_financial_input.database_models import (
     FinancialInputValidationRecord
 )
+from workflow_system.phases.phase1_financial_input.parameters import FinancialInputValidationParams
 from workflow_system.phases.phase1_financial_input.constants import (
     CORE_REQUIRED_FIELDS, VALIDATION_MESSAGES, SystemLimits
 )
 
 logger = logging.getLogger(__name__)
 
+# Blank or "not provided" placeholder strings (matched case-insensitively,
+# ignoring surrounding whitespace)
+_MISSING_RE = re.compile(r'\A\s*(?:none|not specified|null|)\s*\Z', re.IGNORECASE)
+
+# Message reported for each missing core field
+_REQUIRED_FIELD_MESSAGES = {
+    field: VALIDATION_MESSAGES.get(f"{field}_required", f"{field} is required")
+    for field in CORE_REQUIRED_FIELDS
+}
+
+# Fields supplied by the user (computed fields are excluded before conversion)
+_USER_INPUT_FIELDS = frozenset(FinancialInputValidationParams.get_user_input_fields())
+
+
+# Plain currency amounts ("£50,000", "1234.5") are range-checked as integer
+# pence; anything else goes through the Decimal converter
+_AMOUNT_RE = re.compile(r'\A\s*£?\s*(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d{1,2}))?\s*\Z')
+_MIN_FUND_CENTS = int(SystemLimits.MIN_FUND_VALUE * 100)
+_MAX_FUND_CENTS = int(SystemLimits.MAX_FUND_VALUE * 100)
+
+
+def _amount_in_cents(amount: Any, to_decimal: Callable[[Any], Optional[Decimal]]) -> Optional[Any]:
+    """Amount in pence for range checks (int on the fast path, else Decimal)"""
+    if isinstance(amount, str):
+        match = _AMOUNT_RE.match(amount)
+        if match:
+            pounds, pence = match.groups()
+            return int(pounds.replace(',', '')) * 100 + int((pence or '0').ljust(2, '0'))
+    
+    value = to_decimal(amount)
+    return value * 100 if value is not None else None
+
+
+# Type/range validation table, checked in order:
+# (field, converter kind, accepted (low, high) or None,
+#  ((comparison, bound, message), ...), conversion error format)
+# Values inside the accepted range pass with a single chained comparison;
+# the ordered bound checks only run to pick the message for a rejected value
+_TYPE_RANGE_SPECS = (
+    ('valuation_date', 'date', None, (), VALIDATION_MESSAGES.get('valuation_date_format', '{}')),
+    ('end_date', 'date', None, (), "End date format error: {}"),
+    *(
+        (field, 'cents', (_MIN_FUND_CENTS, _MAX_FUND_CENTS), (
+            (operator.le, 0, VALIDATION_MESSAGES.get(f"{field}_positive")),
+            (operator.gt, _MAX_FUND_CENTS, VALIDATION_MESSAGES.get(f"{field}_maximum")),
+            (operator.lt, _MIN_FUND_CENTS, VALIDATION_MESSAGES.get(f"{field}_minimum"))
+        ), f"Invalid amount for {field}: {{}}")
+        for field in ('fund_value', 'surrender_value')
+    ),
+    *(
+        (field, 'integer', (SystemLimits.MIN_AGE, SystemLimits.MAX_AGE), (
+            (operator.lt, SystemLimits.MIN_AGE, VALIDATION_MESSAGES.get('age_minimum')),
+            (operator.gt, SystemLimits.MAX_AGE, VALIDATION_MESSAGES.get('age_maximum'))
+        ), f"Invalid age for {field}: {{}}")
+        for field in ('current_age', 'target_age')
+    ),
+    ('user_input_years', 'integer', (-math.inf, SystemLimits.MAX_TERM_YEARS), (
+        (operator.gt, SystemLimits.MAX_TERM_YEARS, VALIDATION_MESSAGES.get('term_years_maximum')),
+    ), "Invalid years input: {}"),
+    ('user_input_months', 'integer', (0, 11), (
+        (operator.lt, 0, "Months must be between 0 and 11"),
+        (operator.gt, 11, "Months must be between 0 and 11")
+    ), "Invalid months input: {}"),
+)
+
+# Completion message templates (filled with str.format)
+_SUCCESS_TEMPLATE = """
+✅ **Phase 1: Core Input Validation - COMPLETED**
+
+🎉 **All required information has been successfully collected and validated!**
+
+**📋 Summary of Your {product_type} Information:**
+• **Provider:** {provider}
+• **Product:** {product_name}
+• **Current Fund Value:** {fund_value}
+• **Valuation Date:** {valuation_date}
+• **Analysis Type:** {analysis_mode}
+• **Investment Term:** {term_years} years
+
+**✨ Data Quality Score:** {score}/100
+
+**🚀 Ready for next phase of analysis**
+
+Your core financial product information is complete and validated.
+""".strip()
+
+_PENDING_TEMPLATE = """
+⚠️ **Phase 1: Core Input Validation - INCOMPLETE**
+
+📝 **Missing Required Information:**
+{missing}
+
+**Current Progress:**
+• **Provider:** {provider}
+• **Product Type:** {product_type}
+• **Fund Value:** {fund_value}
+
+Please provide the missing information to complete Phase 1 validation.
+""".strip()
+
+_ERROR_TEMPLATE = """
+❌ **Phase 1: Core Input Validation - VALIDATION FAILED**
+
+**Issues Found:**
+{issues}
+
+Please correct these issues and try again.
+""".strip()
+
+# Display fields read by the success message, with their fallbacks
+# (argument order of _render_success_message)
+_SUCCESS_FIELDS = (
+    ('product_type', 'financial product'),
+    ('provider_name', 'Unknown provider'),
+    ('product_name', 'Not specified'),
+    ('fund_value', 'Not specified'),
+    ('valuation_date', 'Not specified'),
+    ('analysis_mode', 'analysis'),
+    ('term_years', 'Not specified'),
+)
+
+
+@lru_cache(maxsize=1024)
+def _render_success_message(product_type: str, provider: str, product_name: str, fund_value: str,
+                            valuation_date: str, analysis_mode: str, term_years: str, score: int) -> str:
+    """Render the success message (cached: completed phases are re-read repeatedly)"""
+    return _SUCCESS_TEMPLATE.format(
+        product_type=product_type.title(),
+        provider=provider,
+        product_name=product_name,
+        fund_value=fund_value,
+        valuation_date=valuation_date,
+        analysis_mode=analysis_mode.title(),
+        term_years=term_years,
+        score=score
+    )
+
+
+# User-friendly names for fields listed in the pending message
+_FRIENDLY_NAMES = {
+    'valuation_date': 'Valuation Date',
+    'provider_name': 'Provider Name',
+    'product_name': 'Product Name',
+    'product_type': 'Product Type',
+    'fund_value': 'Current Fund Value',
+    'surrender_value': 'Surrender/Transfer Value',
+    'investment_term_type': 'Investment Term Type',
+    'current_age': 'Client Age',
+    'target_age': 'Target Age',
+    'end_date': 'End Date',
+    'user_input_years': 'Number of Years',
+    'include_taxation': 'Include Tax Analysis',
+    'tax_band': 'Tax Band'
+}
+
+# Title-cased names for other fields, filled on first use
+_FRIENDLY_NAMES_FALLBACK: Dict[str, str] = {}
+
+
+def _fallback_friendly_name(field: str) -> str:
+    """Title-cased name for a field without an explicit friendly name"""
+    name = _FRIENDLY_NAMES_FALLBACK.get(field)
+    if name is None:
+        name = _FRIENDLY_NAMES_FALLBACK.setdefault(field, field.replace('_', ' ').title())
+    return name
+
+
+@dataclass(slots=True)
+class ValidationSummary:
+    """The validation_results block of a Phase 1 workflow result"""
+    is_complete: bool
+    missing_fields: List[str]
+    validation_errors: List[str]
+    data_quality_score: Any = 0
+    completion_percentage: float = 0.0
+    validation_warnings: Optional[List[str]] = None  # omitted from the dict when None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form (key order as returned by the workflow)"""
+        summary = {
+            "is_complete": self.is_complete,
+            "missing_fields": self.missing_fields,
+            "validation_errors": self.validation_errors
+        }
+        if self.validation_warnings is not None:
+            summary["validation_warnings"] = self.validation_warnings
+        summary["data_quality_score"] = self.data_quality_score
+        summary["completion_percentage"] = self.completion_percentage
+        return summary
+
+
+@dataclass(slots=True)
+class Phase1ValidationResult:
+    """Result of one Phase 1 validation run (the workflow returns its to_dict())"""
+    status: str
+    completion_message: str
+    validation_results: ValidationSummary
+    completed_at: str
+    metadata: Dict[str, Any]
+    processed_data: Dict[str, str]
+    database_values: Dict[str, Any]
+    database_record: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None  # only set for critical failures
+    phase: str = "Phase 1: Core Input Validation and Initial Values"
+    workflow_type: str = "financial_input_validation"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for the workflow engine and JSON responses"""
+        result = {
+            "status": self.status,
+            "phase": self.phase,
+            "completion_message": self.completion_message,
+            "processed_data": self.processed_data,
+            "database_values": self.database_values,
+            "database_record": self.database_record,
+            "validation_results": self.validation_results.to_dict(),
+            "completed_at": self.completed_at,
+            "workflow_type": self.workflow_type,
+            "metadata": self.metadata
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
 
 class Phase1WorkflowProcessor:
     """Enhanced processor for Phase 1 workflow with database integration"""
@@ -28,13 +258,25 @@ class Phase1WorkflowProcessor:
     def __init__(self):
         self.data_converter = Phase1DataConverter()
         self.field_calculator = Phase1FieldCalculator()
+        
+        # Bound converters keyed by _TYPE_RANGE_SPECS kind
+        type_converter = self.data_converter.type_converter
+        self._type_converters = {
+            'date': type_converter.to_database_date,
+            'decimal': type_converter.to_database_decimal,
+            'integer': type_converter.to_database_integer,
+            # partial rather than a bound method: no processor <-> dict cycle
+            'cents': partial(_amount_in_cents, to_decimal=type_converter.to_database_decimal)
+        }
         self.validation_errors = []
         self.processing_warnings = []
         
     def clear_errors_and_warnings(self):
         """Clear all errors and warnings"""
-        self.validation_errors.clear()
-        self.processing_warnings.clear()
+        # Rebind rather than clear in place: earlier workflow results keep
+        # references to these lists when the processor is reused
+        self.validation_errors = []
+        self.processing_warnings = []
         self.field_calculator.clear_errors()
     
     def validate_core_requirements(self, params: Dict[str, Any]) -> List[str]:
@@ -43,9 +285,8 @@ class Phase1WorkflowProcessor:
         
         for field in CORE_REQUIRED_FIELDS:
             value = params.get(field)
-            if not value or str(value).strip().lower() in ['', 'none', 'not specified', 'null']:
-                field_message = VALIDATION_MESSAGES.get(f"{field}_required", f"{field} is required")
-                errors.append(field_message)
+            if not value or (isinstance(value, str) and _MISSING_RE.match(value)):
+                errors.append(_REQUIRED_FIELD_MESSAGES[field])
         
         return errors
     
@@ -54,92 +295,64 @@ class Phase1WorkflowProcessor:
         errors = []
         
         try:
-            # Validate dates
-            valuation_date = params.get('valuation_date')
-            if valuation_date:
-                try:
-                    self.data_converter.type_converter.to_database_date(valuation_date)
-                except ValueError as e:
-                    errors.append(VALIDATION_MESSAGES.get('valuation_date_format', str(e)))
+            converters = self._type_converters
             
-            end_date = params.get('end_date')
-            if end_date:
-                try:
-                    self.data_converter.type_converter.to_database_date(end_date)
-                except ValueError as e:
-                    errors.append(f"End date format error: {str(e)}")
-            
-            # Validate currency amounts
-            for field in ['fund_value', 'surrender_value']:
-                value_str = params.get(field)
-                if value_str:
-                    try:
-                        decimal_value = self.data_converter.type_converter.to_database_decimal(value_str)
-                        if decimal_value:
-                            if decimal_value <= 0:
-                                errors.append(VALIDATION_MESSAGES.get(f"{field}_positive"))
-                            elif decimal_value > SystemLimits.MAX_FUND_VALUE:
-                                errors.append(VALIDATION_MESSAGES.get(f"{field}_maximum"))
-                            elif decimal_value < SystemLimits.MIN_FUND_VALUE:
-                                errors.append(VALIDATION_MESSAGES.get(f"{field}_minimum"))
-                    except ValueError as e:
-                        errors.append(f"Invalid amount for {field}: {str(e)}")
+            try:
+                # Common case: every supplied field converts, so run all the
+                # conversions under a single handler
+                converted = [
+                    (converters[kind](raw_value), accepted, bound_checks)
+                    for field, kind, accepted, bound_checks, _ in _TYPE_RANGE_SPECS
+                    if (raw_value := params.get(field))
+                ]
+            except Exception:
+                converted = None
             
-            # Validate ages
-            for field in ['current_age', 'target_age']:
-                age_str = params.get(field)
-                if age_str:
+            if converted is not None:
+                for value, accepted, bound_checks in converted:
+                    self._check_range(value, accepted, bound_checks, errors)
+            else:
+                # A conversion failed: re-run field by field so each failure is
+                # reported in table order alongside the range errors
+                for field, kind, accepted, bound_checks, invalid_format in _TYPE_RANGE_SPECS:
+                    raw_value = params.get(field)
+                    if not raw_value:
+                        continue
                     try:
-                        age_value = self.data_converter.type_converter.to_database_integer(age_str)
-                        if age_value:
-                            if age_value < SystemLimits.MIN_AGE:
-                                errors.append(VALIDATION_MESSAGES.get('age_minimum'))
-                            elif age_value > SystemLimits.MAX_AGE:
-                                errors.append(VALIDATION_MESSAGES.get('age_maximum'))
+                        value = converters[kind](raw_value)
                     except ValueError as e:
-                        errors.append(f"Invalid age for {field}: {str(e)}")
-            
-            # Validate year inputs
-            years_str = params.get('user_input_years')
-            if years_str:
-                try:
-                    years_value = self.data_converter.type_converter.to_database_integer(years_str)
-                    if years_value and years_value > SystemLimits.MAX_TERM_YEARS:
-                        errors.append(VALIDATION_MESSAGES.get('term_years_maximum'))
-                except ValueError as e:
-                    errors.append(f"Invalid years input: {str(e)}")
-            
-            months_str = params.get('user_input_months')
-            if months_str:
-                try:
-                    months_value = self.data_converter.type_converter.to_database_integer(months_str)
-                    if months_value and (months_value < 0 or months_value > 11):
-                        errors.append("Months must be between 0 and 11")
-                except ValueError as e:
-                    errors.append(f"Invalid months input: {str(e)}")
+                        errors.append(invalid_format.format(e))
+                        continue
+                    
+                    self._check_range(value, accepted, bound_checks, errors)
                     
         except Exception as e:
-            logger.error(f"Error during data validation: {e}")
+            logger.error("Error during data validation: %s", e)
             errors.append(f"Validation error: {str(e)}")
         
         return errors
     
+    @staticmethod
+    def _check_range(value: Any, accepted: Optional[tuple], bound_checks: tuple, errors: List[str]) -> None:
+        """Append the first failing bound-check message for a converted value"""
+        # Bound checks apply to non-empty converted values; first failure wins
+        if value and accepted and not accepted[0] <= value <= accepted[1]:
+            for compare, bound, message in bound_checks:
+                if compare(value, bound):
+                    errors.append(message)
+                    break
+    
     def process_and_convert_data(self, params: Dict[str, Any]) -> tuple[Dict[str, Any], Dict[str, str]]:
         """
         Process and convert all field data
         Returns: (database_values, formatted_display_values)
         """
         try:
-            # Get user input fields only (exclude computed fields)
-            from workflow_system.phases.phase1_financial_input.parameters import FinancialInputValidationParams
-            user_input_fields = FinancialInputValidationParams.get_user_input_fields()
-            
-            # Filter to only user input fields
-            user_params = {k: v for k, v in params.items() if k in user_input_fields}
+            # Filter to only user input fields (exclude computed fields)
+            user_params = {k: v for k, v in params.items() if k in _USER_INPUT_FIELDS}
             
-            # Convert user input fields
-            database_values = self.data_converter.get_database_values(user_params)
-            display_values = self.data_converter.get_display_values(user_params)
+            # Convert user input fields (one pass yields both representations)
+            database_values, display_values = self.data_converter.get_database_and_display_values(user_params)
             
             # Calculate computed fields
             calculated_fields = self.field_calculator.calculate_all_fields(
@@ -161,7 +374,7 @@ class Phase1WorkflowProcessor:
             return database_values, display_values
             
         except Exception as e:
-            logger.error(f"Error during data processing: {e}")
+            logger.error("Error during data processing: %s", e)
             self.validation_errors.append(f"Data processing error: {str(e)}")
             return {}, {}
     
@@ -170,10 +383,11 @@ class Phase1WorkflowProcessor:
         try:
             return BusinessRuleValidator.validate_all_business_rules(database_values)
         except Exception as e:
-            logger.error(f"Error during business rule validation: {e}")
+            logger.error("Error during business rule validation: %s", e)
             return [f"Business rule validation error: {str(e)}"]
     
-    def create_database_record(self, database_values: Dict[str, Any],  display_values: Dict[str, str],  session_id: Optional[str] = None) -> FinancialInputValidationRecord:
+    def create_database_record(self, database_values: Dict[str, Any],  display_values: Dict[str, str],  session_id: Optional[str] = None,
+                               now: Optional[datetime.datetime] = None) -> FinancialInputValidationRecord:
         """Create database record from processed values - FIXED VERSION"""
         try:
             # Create record from database values
@@ -191,8 +405,7 @@ class Phase1WorkflowProcessor:
             record.validation_errors = database_values.get('validation_errors')
             
             # Set timestamps
-            record.created_at = datetime.datetime.utcnow()
-            record.updated_at = datetime.datetime.utcnow()
+            record.created_at = record.updated_at = now or datetime.datetime.utcnow()
             
             # Convert to full database record with formatting
             db_record = record.to_database_record(display_values)
@@ -200,7 +413,7 @@ class Phase1WorkflowProcessor:
             return db_record
             
         except Exception as e:
-            logger.error(f"Error creating database record: {e}")
+            logger.error("Error creating database record: %s", e)
             raise ValueError(f"Database record creation failed: {str(e)}")
     
     def generate_completion_message(self, database_values: Dict[str, Any], 
@@ -219,37 +432,16 @@ class Phase1WorkflowProcessor:
                 return self._generate_error_message(missing_fields, self.validation_errors)
                 
         except Exception as e:
-            logger.error(f"Error generating completion message: {e}")
+            logger.error("Error generating completion message: %s", e)
             return f"❌ Error generating completion message: {str(e)}"
     
     def _generate_success_message(self, database_values: Dict[str, Any], 
                                 display_values: Dict[str, str], 
                                 score: int) -> str:
         """Generate success completion message"""
-        product_type = display_values.get('product_type', 'financial product')
-        provider = display_values.get('provider_name', 'Unknown provider')
-        fund_value = display_values.get('fund_value', 'Not specified')
-        analysis_mode = display_values.get('analysis_mode', 'analysis')
-        
-        return f"""
-✅ **Phase 1: Core Input Validation - COMPLETED**
-
-🎉 **All required information has been successfully collected and validated!**
-
-**📋 Summary of Your {product_type.title()} Information:**
-• **Provider:** {provider}
-• **Product:** {display_values.get('product_name', 'Not specified')}
-• **Current Fund Value:** {fund_value}
-• **Valuation Date:** {display_values.get('valuation_date', 'Not specified')}
-• **Analysis Type:** {analysis_mode.title()}
-• **Investment Term:** {display_values.get('term_years', 'Not specified')} years
-
-**✨ Data Quality Score:** {score}/100
-
-**🚀 Ready for next phase of analysis**
-
-Your core financial product information is complete and validated.
-        """.strip()
+        return _render_success_message(
+            *[display_values.get(field, default) for field, default in _SUCCESS_FIELDS], score
+        )
     
     def _generate_pending_message(self, missing_fields: List[str], 
                                 display_values: Dict[str, str]) -> str:
@@ -258,38 +450,15 @@ Your core financial product information is complete and validated.
             missing_fields = ["Some required fields"]
             
         # Convert field names to user-friendly format
-        friendly_names = {
-            'valuation_date': 'Valuation Date',
-            'provider_name': 'Provider Name',
-            'product_name': 'Product Name',
-            'product_type': 'Product Type',
-            'fund_value': 'Current Fund Value',
-            'surrender_value': 'Surrender/Transfer Value',
-            'investment_term_type': 'Investment Term Type',
-            'current_age': 'Client Age',
-            'target_age': 'Target Age',
-            'end_date': 'End Date',
-            'user_input_years': 'Number of Years',
-            'include_taxation': 'Include Tax Analysis',
-            'tax_band': 'Tax Band'
-        }
+        missing_friendly = [_FRIENDLY_NAMES.get(field) or _fallback_friendly_name(field)
+                            for field in missing_fields]
         
-        missing_friendly = [friendly_names.get(field, field.replace('_', ' ').title()) 
-                          for field in missing_fields]
-        
-        return f"""
-⚠️ **Phase 1: Core Input Validation - INCOMPLETE**
-
-📝 **Missing Required Information:**
-{chr(10).join(f'• {field}' for field in missing_friendly)}
-
-**Current Progress:**
-• **Provider:** {display_values.get('provider_name', 'Not specified')}
-• **Product Type:** {display_values.get('product_type', 'Not specified')}
-• **Fund Value:** {display_values.get('fund_value', 'Not specified')}
-
-Please provide the missing information to complete Phase 1 validation.
-        """.strip()
+        return _PENDING_TEMPLATE.format(
+            missing="\n".join(f'• {field}' for field in missing_friendly),
+            provider=display_values.get('provider_name', 'Not specified'),
+            product_type=display_values.get('product_type', 'Not specified'),
+            fund_value=display_values.get('fund_value', 'Not specified')
+        )
     
     def _generate_error_message(self, missing_fields: List[str], 
                               validation_errors: List[str]) -> str:
@@ -304,14 +473,9 @@ Please provide the missing information to complete Phase 1 validation.
         if validation_errors:
             error_summary.extend(validation_errors[:2])  # Show first 2 errors
             
-        return f"""
-❌ **Phase 1: Core Input Validation - VALIDATION FAILED**
-
-**Issues Found:**
-{chr(10).join(f'• {error}' for error in error_summary)}
-
-Please correct these issues and try again.
-        """.strip()
+        return _ERROR_TEMPLATE.format(
+            issues="\n".join(f'• {error}' for error in error_summary)
+        )
 
 
 def financial_input_validation_workflow(params: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
@@ -326,9 +490,32 @@ def financial_input_validation_workflow(params: Dict[str, Any], session_id: Opti
     Returns:
         Dictionary containing workflow results, database record, and formatted data
     """
-    logger.info(f"Executing enhanced financial input validation workflow with params: {list(params.keys())}")
+    return _run_financial_input_validation(Phase1WorkflowProcessor(), params, session_id).to_dict()
+
+
+def financial_input_validation_batch(params_list: List[Dict[str, Any]],
+                                     session_id: Optional[str] = None,
+                                     as_dicts: bool = True) -> List[Any]:
+    """
+    Run Phase 1 validation over many parameter sets (e.g. bulk re-validation)
     
+    One Phase1WorkflowProcessor is shared across the batch; each entry gets
+    the same result as financial_input_validation_workflow. Pass
+    as_dicts=False to keep the Phase1ValidationResult objects instead
+    (lighter when many results are held, e.g. queued).
+    """
     processor = Phase1WorkflowProcessor()
+    results = [_run_financial_input_validation(processor, params, session_id) for params in params_list]
+    return [result.to_dict() for result in results] if as_dicts else results
+
+
+def _run_financial_input_validation(processor: Phase1WorkflowProcessor, params: Dict[str, Any],
+                                    session_id: Optional[str]) -> Phase1ValidationResult:
+    """Run the Phase 1 validation steps for one parameter set"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Executing enhanced financial input validation workflow with params: %s", list(params.keys()))
+    
+    now = datetime.datetime.utcnow()
     
     try:
         # Clear any previous errors
@@ -361,16 +548,13 @@ def financial_input_validation_workflow(params: Dict[str, Any], session_id: Opti
         # INCOMPLETE = Missing fields OR critical errors
         # WARNINGS = Completed but with warnings (like ISA tax info)
         
-        has_critical_errors = any(
+        # Missing fields already make the run incomplete, so the error scan
+        # only runs when every required field is present
+        is_complete = len(missing_fields) == 0 and not any(
             error for error in validation_errors 
             if "must be" in error.lower() or "required" in error.lower() or "cannot" in error.lower()
         )
         
-        is_complete = (
-            len(missing_fields) == 0 and 
-            not has_critical_errors
-        )
-        
         # Generate appropriate status
         if is_complete:
             if validation_warnings:
@@ -392,75 +576,73 @@ def financial_input_validation_workflow(params: Dict[str, Any], session_id: Opti
         if status != "failed":
             try:
                 database_record = processor.create_database_record(
-                    database_values, display_values, session_id
+                    database_values, display_values, session_id, now
                 )
             except Exception as e:
-                logger.error(f"Failed to create database record: {e}")
+                logger.error("Failed to create database record: %s", e)
         
         # Step 7: Generate completion message
         completion_message = processor.generate_completion_message(database_values, display_values)
         
         # Step 8: Prepare workflow result
         status = "completed" if is_complete else "incomplete"
+        get_value = database_values.get
+        data_quality_score = get_value('data_quality_score', 0)
+        completion_percentage = float(get_value('completion_percentage', 0))
+        analysis_mode = get_value('analysis_mode')
+        product_type = get_value('product_type')
         
-        result = {
-            "status": status,  # Use the determined status
-            "phase": "Phase 1: Core Input Validation and Initial Values",
-            "completion_message": completion_message,
-            "processed_data": display_values,
-            "database_values": database_values,
-            "database_record": database_record.get_insert_data() if database_record else None,
-            "validation_results": {
-                "is_complete": is_complete,
-                "missing_fields": missing_fields,
-                "validation_errors": validation_errors,
-                "validation_warnings": validation_warnings,  # NEW: separate warnings
-                "data_quality_score": database_values.get('data_quality_score', 0),
-                "completion_percentage": float(database_values.get('completion_percentage', 0))
-            },
-            "completed_at": datetime.datetime.utcnow().isoformat(),
-            "workflow_type": "financial_input_validation",
-            "metadata": {
+        result = Phase1ValidationResult(
+            status=status,  # Use the determined status
+            completion_message=completion_message,
+            processed_data=display_values,
+            database_values=database_values,
+            database_record=database_record.get_insert_data() if database_record else None,
+            validation_results=ValidationSummary(
+                is_complete=is_complete,
+                missing_fields=missing_fields,
+                validation_errors=validation_errors,
+                validation_warnings=validation_warnings,  # NEW: separate warnings
+                data_quality_score=data_quality_score,
+                completion_percentage=completion_percentage
+            ),
+            completed_at=now.isoformat(),
+            metadata={
                 "session_id": session_id,
                 "total_user_fields": len(params),
                 "processed_fields": len(database_values),
                 "display_fields": len(display_values),
                 "ready_for_next_phase": is_complete,
-                "analysis_mode": database_values.get('analysis_mode'),
-                "product_type": database_values.get('product_type'),
+                "analysis_mode": analysis_mode,
+                "product_type": product_type,
                 "has_warnings": len(validation_warnings) > 0,
                 "has_errors": len(validation_errors) > 0
             }
-        }
+        )
         
-        logger.info(f"Enhanced financial input validation completed. Status: {status}")
-        logger.info(f"Data quality score: {database_values.get('data_quality_score', 0)}/100")
+        logger.info("Enhanced financial input validation completed. Status: %s", status)
+        logger.info("Data quality score: %s/100", data_quality_score)
         
         return result
         
     except Exception as e:
-        logger.error(f"Critical error in enhanced financial input validation: {e}", exc_info=True)
+        logger.error("Critical error in enhanced financial input validation: %s", e, exc_info=True)
         
-        return {
-            "status": "failed",
-            "phase": "Phase 1: Core Input Validation and Initial Values",
-            "completion_message": f"❌ **Critical Error**: {str(e)}",
-            "processed_data": {},
-            "database_values": {},
-            "database_record": None,
-            "validation_results": {
-                "is_complete": False,
-                "missing_fields": [],
-                "validation_errors": [str(e)],
-                "data_quality_score": 0,
-                "completion_percentage": 0.0
-            },
-            "completed_at": datetime.datetime.utcnow().isoformat(),
-            "workflow_type": "financial_input_validation",
-            "error": str(e),
-            "metadata": {
+        return Phase1ValidationResult(
+            status="failed",
+            completion_message=f"❌ **Critical Error**: {str(e)}",
+            processed_data={},
+            database_values={},
+            validation_results=ValidationSummary(
+                is_complete=False,
+                missing_fields=[],
+                validation_errors=[str(e)]
+            ),
+            completed_at=now.isoformat(),
+            error=str(e),
+            metadata={
                 "session_id": session_id,
                 "error_type": type(e).__name__,
                 "ready_for_next_phase": False
             }
-        }
\ No newline at end of file
+        )
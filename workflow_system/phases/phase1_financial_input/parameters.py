@@ -3,57 +3,184 @@ Enhanced Parameters for Phase 1: Core Input Validation and Initial Values
 File: workflow_system/phases/phase1_financial_input/parameters.py (UPDATED)
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Tuple
 from datetime import date
-from decimal import Decimal
 
+from workflow_system.utils.schema import field_examples_hook
 from workflow_system.phases.phase1_financial_input.constants import (
     ProductType, InvestmentTermType, TaxBand, AnalysisMode, SystemLimits
 )
 
+# Accepted enum values for the validators
+_PRODUCT_TYPE_VALUES = frozenset(pt.value for pt in ProductType)
+_TERM_TYPE_VALUES = frozenset(itt.value for itt in InvestmentTermType)
+_TAX_BAND_VALUES = frozenset(tb.value for tb in TaxBand)
+
+# Common product type names mapped to their ProductType value
+_PRODUCT_ALIASES = {
+    'stocks_shares_isa': 'stocks_shares_isa',
+    'stocks_and_shares_isa': 'stocks_shares_isa',
+    'personal_pension': 'pension',
+    'workplace_pension': 'pension',
+    'stakeholder_pension': 'pension'
+}
+
+# Tax bands given as a percentage ("20%")
+_TAX_PERCENT_MAP = {
+    '20': TaxBand.BASIC_RATE.value,
+    '40': TaxBand.HIGHER_RATE.value,
+    '45': TaxBand.ADDITIONAL_RATE.value
+}
+
+# Spaces, hyphens and ampersands in product type names become underscores
+_PRODUCT_TYPE_TRANS = str.maketrans({' ': '_', '-': '_', '&': '_'})
+
+# Validation error messages (values listed in enum order)
+_PRODUCT_TYPE_ERROR = f"Invalid product type. Must be one of: {', '.join(pt.value for pt in ProductType)}"
+_TERM_TYPE_ERROR = f"Invalid investment term type. Must be one of: {', '.join(itt.value for itt in InvestmentTermType)}"
+_TAX_BAND_ERROR = f"Invalid tax band. Must be one of: {', '.join(tb.value for tb in TaxBand)}"
+
+
+def _to_str(v):
+    """Convert non-None input values to strings (before field validation)"""
+    return None if v is None else str(v)
+
+
+# ============================================================================
+# FIELD GROUPINGS (shared, immutable)
+# ============================================================================
+
+_COMPUTED_FIELDS = (
+    'term_years',
+    'initial_investment_value',
+    'analysis_mode',
+    'client_tax_rate',
+    'missing_fields',
+    'data_quality_score',
+    'completion_percentage',
+    'validation_status',
+    'validation_errors'
+)
+
+_USER_INPUT_FIELDS = (
+    'valuation_date', 'provider_name', 'product_name', 'product_type',
+    'fund_value', 'surrender_value', 'investment_term_type',
+    'end_date', 'user_input_years', 'user_input_months',
+    'current_age', 'target_age', 'include_taxation', 'tax_band',
+    'performing_switch_analysis'
+)
+
+# User input fields asked for every product (tax fields are conditional)
+_PRODUCT_BASE_FIELDS = (
+    'valuation_date', 'provider_name', 'product_name', 'product_type',
+    'fund_value', 'surrender_value', 'investment_term_type',
+    'end_date', 'user_input_years', 'user_input_months',
+    'current_age', 'target_age', 'performing_switch_analysis'
+)
+
+_CORE_REQUIRED_FIELDS = (
+    'valuation_date', 'provider_name', 'product_name', 'product_type',
+    'fund_value', 'surrender_value', 'investment_term_type'
+)
+
+# Placeholder strings that count as "not provided"
+_MISSING_SENTINELS = frozenset({'', 'none', 'not specified'})
+
+
+def _is_missing(value) -> bool:
+    """Check whether a field value is empty or a "not provided" placeholder"""
+    return not value or (isinstance(value, str) and value.strip().lower() in _MISSING_SENTINELS)
+
+
+# Additional required fields by product type
+_PENSION_REQUIRED = ('current_age', 'include_taxation', 'tax_band')
+_INVESTMENT_REQUIRED = ('include_taxation', 'tax_band')
+_INSURANCE_REQUIRED = ('current_age',)
+_CONDITIONAL_BY_PRODUCT = {
+    'pension': _PENSION_REQUIRED,
+    'sipp': _PENSION_REQUIRED,
+    'investment_bond': _INVESTMENT_REQUIRED,
+    'unit_trust': _INVESTMENT_REQUIRED,
+    'oeic': _INVESTMENT_REQUIRED,
+    'investment_trust': _INVESTMENT_REQUIRED,
+    'life_insurance': _INSURANCE_REQUIRED,
+    'endowment': _INSURANCE_REQUIRED,
+    'whole_of_life': _INSURANCE_REQUIRED,
+    'critical_illness_cover': _INSURANCE_REQUIRED
+}
+
+# Required fields by investment term type (user_input_months is optional)
+_TERM_TYPE_FIELDS = {
+    'until': ('end_date',),
+    'years': ('user_input_years',),
+    'age': ('current_age', 'target_age')
+}
+
+
+# Example inputs per user field, kept out of the FieldInfo objects and only
+# added when a JSON schema is generated or examples are requested
+_FIELD_EXAMPLES = {
+    'valuation_date': ("15/03/2024", "01/01/2024", "today", "31/12/2023"),
+    'provider_name': ("Aviva", "Standard Life", "Vanguard", "AJ Bell", "Hargreaves Lansdown", "Legal & General"),
+    'product_name': ("Personal Pension Plan", "SIPP", "Stocks & Shares ISA", "Investment Bond", "Unit Trust"),
+    'product_type': ("pension", "sipp", "isa", "stocks_shares_isa", "investment_bond", "unit_trust", "oeic"),
+    'fund_value': ("£50000", "50k", "fifty thousand", "£125,000", "200000"),
+    'surrender_value': ("£48000", "45k", "same as fund value", "£95,000", "190000"),
+    'investment_term_type': ("until", "years", "age"),
+    'end_date': ("01/04/2030", "15/12/2035", "31/03/2040"),
+    'user_input_years': ("10", "15", "20", "25", "thirty"),
+    'user_input_months': ("0", "6", "9", "11"),
+    'current_age': ("45", "forty-five", "aged 45", "45 years old", "35"),
+    'target_age': ("65", "67", "sixty", "retirement age", "55"),
+    'include_taxation': ("yes", "no", "true", "false", "include tax", "exclude tax"),
+    'tax_band': ("basic_rate_20", "higher_rate_40", "additional_rate_45", "20%", "40%", "45%"),
+    'performing_switch_analysis': ("yes", "no", "switch", "transfer", "optimize", "rebalance")
+}
+
 
 class FinancialInputValidationParams(BaseModel):
     """Enhanced parameters for Phase 1: Core Input Validation and Initial Values"""
     
+    # Unknown keys are dropped rather than stored; string inputs are stripped
+    # by pydantic-core before the validators run
+    model_config = ConfigDict(
+        extra='ignore', validate_assignment=False, str_strip_whitespace=True,
+        json_schema_extra=field_examples_hook(_FIELD_EXAMPLES)
+    )
+    
     # ============================================================================
     # CORE FINANCIAL DATA (Always Required)
     # ============================================================================
     
     valuation_date: Optional[str] = Field(
         default=None,
-        description="Valuation date in dd/mm/yyyy format - baseline date for all calculations",
-        examples=["15/03/2024", "01/01/2024", "today", "31/12/2023"]
+        description="Valuation date in dd/mm/yyyy format - baseline date for all calculations"
     )
     
     provider_name: Optional[str] = Field(
         default=None,
-        description="Name of the financial provider managing the product",
-        examples=["Aviva", "Standard Life", "Vanguard", "AJ Bell", "Hargreaves Lansdown", "Legal & General"]
+        description="Name of the financial provider managing the product"
     )
     
     product_name: Optional[str] = Field(
         default=None,
-        description="Specific name/label of the financial product as designated by provider",
-        examples=["Personal Pension Plan", "SIPP", "Stocks & Shares ISA", "Investment Bond", "Unit Trust"]
+        description="Specific name/label of the financial product as designated by provider"
     )
     
     product_type: Optional[str] = Field(
         default=None,
-        description="Regulatory classification of the financial product",
-        examples=["pension", "sipp", "isa", "stocks_shares_isa", "investment_bond", "unit_trust", "oeic"]
+        description="Regulatory classification of the financial product"
     )
     
     fund_value: Optional[str] = Field(
         default=None,
-        description="Current market value of the financial product in pounds",
-        examples=["£50000", "50k", "fifty thousand", "£125,000", "200000"]
+        description="Current market value of the financial product in pounds"
     )
     
     surrender_value: Optional[str] = Field(
         default=None,
-        description="Amount receivable if product cashed in/transferred today",
-        examples=["£48000", "45k", "same as fund value", "£95,000", "190000"]
+        description="Amount receivable if product cashed in/transferred today"
     )
     
     # ============================================================================
@@ -62,41 +189,35 @@ class FinancialInputValidationParams(BaseModel):
     
     investment_term_type: Optional[str] = Field(
         default=None,
-        description="Method to define investment analysis period: until date, for years, or until age",
-        examples=["until", "years", "age"]
+        description="Method to define investment analysis period: until date, for years, or until age"
     )
     
     # Used when investment_term_type = "until"
     end_date: Optional[str] = Field(
         default=None,
-        description="End date for analysis when term type is 'until' (dd/mm/yyyy format)",
-        examples=["01/04/2030", "15/12/2035", "31/03/2040"]
+        description="End date for analysis when term type is 'until' (dd/mm/yyyy format)"
     )
     
     # Used when investment_term_type = "years"
     user_input_years: Optional[str] = Field(
         default=None,
-        description="Number of years for analysis when term type is 'years'",
-        examples=["10", "15", "20", "25", "thirty"]
+        description="Number of years for analysis when term type is 'years'"
     )
     
     user_input_months: Optional[str] = Field(
         default=None,
-        description="Additional months (0-11) when term type is 'years'",
-        examples=["0", "6", "9", "11"]
+        description="Additional months (0-11) when term type is 'years'"
     )
     
     # Used when investment_term_type = "age"
     current_age: Optional[str] = Field(
         default=None,
-        description="Client's current age (required for pension and insurance products)",
-        examples=["45", "forty-five", "aged 45", "45 years old", "35"]
+        description="Client's current age (required for pension and insurance products)"
     )
     
     target_age: Optional[str] = Field(
         default=None,
-        description="Age client wants to reach for analysis when term type is 'age'",
-        examples=["65", "67", "sixty", "retirement age", "55"]
+        description="Age client wants to reach for analysis when term type is 'age'"
     )
     
     # ============================================================================
@@ -105,14 +226,12 @@ class FinancialInputValidationParams(BaseModel):
     
     include_taxation: Optional[str] = Field(
         default=None,
-        description="Whether to include tax implications in analysis (not needed for ISAs)",
-        examples=["yes", "no", "true", "false", "include tax", "exclude tax"]
+        description="Whether to include tax implications in analysis (not needed for ISAs)"
     )
     
     tax_band: Optional[str] = Field(
         default=None,
-        description="Client's current tax band for tax analysis",
-        examples=["basic_rate_20", "higher_rate_40", "additional_rate_45", "20%", "40%", "45%"]
+        description="Client's current tax band for tax analysis"
     )
     
     # ============================================================================
@@ -121,67 +240,7 @@ class FinancialInputValidationParams(BaseModel):
     
     performing_switch_analysis: Optional[str] = Field(
         default=None,
-        description="Whether analyzing product switching vs optimization within current product",
-        examples=["yes", "no", "switch", "transfer", "optimize", "rebalance"]
-    )
-    
-    # ============================================================================
-    # COMPUTED/CALCULATED FIELDS (Auto-calculated, not user input)
-    # ============================================================================
-    
-    # These fields are calculated automatically and should not be in user prompts
-    term_years: Optional[Union[str, Decimal]] = Field(
-        default=None,
-        description="Calculated investment term in years (auto-calculated)",
-        exclude=True
-    )
-    
-    initial_investment_value: Optional[Union[str, Decimal]] = Field(
-        default=None,
-        description="Starting value for analysis - fund_value or surrender_value (auto-calculated)",
-        exclude=True
-    )
-    
-    analysis_mode: Optional[str] = Field(
-        default=None,
-        description="Analysis mode: switching or remodeling (auto-calculated)",
-        exclude=True
-    )
-    
-    client_tax_rate: Optional[Union[str, Decimal]] = Field(
-        default=None,
-        description="Tax rate as decimal from tax_band (auto-calculated)",
-        exclude=True
-    )
-    
-    missing_fields: Optional[List[str]] = Field(
-        default=None,
-        description="List of missing required fields (auto-calculated)",
-        exclude=True
-    )
-    
-    data_quality_score: Optional[int] = Field(
-        default=None,
-        description="Data quality score 0-100 (auto-calculated)",
-        exclude=True
-    )
-    
-    completion_percentage: Optional[Union[str, Decimal]] = Field(
-        default=None,
-        description="Completion percentage (auto-calculated)",
-        exclude=True
-    )
-    
-    validation_status: Optional[str] = Field(
-        default=None,
-        description="Overall validation status (auto-calculated)",
-        exclude=True
-    )
-    
-    validation_errors: Optional[List[str]] = Field(
-        default=None,
-        description="List of validation errors (auto-calculated)",
-        exclude=True
+        description="Whether analyzing product switching vs optimization within current product"
     )
     
     # ============================================================================
@@ -189,101 +248,55 @@ class FinancialInputValidationParams(BaseModel):
     # ============================================================================
     
     @classmethod
-    def get_computed_fields(cls) -> List[str]:
-        """Get list of computed/auto-calculated fields that should never be asked to users"""
-        return [
-            'term_years',
-            'initial_investment_value', 
-            'analysis_mode',
-            'client_tax_rate',
-            'missing_fields',
-            'data_quality_score',
-            'completion_percentage',
-            'validation_status', 
-            'validation_errors'
-        ]
+    def get_computed_fields(cls) -> Tuple[str, ...]:
+        """Get computed/auto-calculated fields that should never be asked to users"""
+        return _COMPUTED_FIELDS
 
     @classmethod
-    def get_user_input_fields(cls) -> List[str]:
-        """Get list of fields that require user input (exclude computed fields)"""
-        return [
-            'valuation_date', 'provider_name', 'product_name', 'product_type',
-            'fund_value', 'surrender_value', 'investment_term_type',
-            'end_date', 'user_input_years', 'user_input_months',
-            'current_age', 'target_age', 'include_taxation', 'tax_band',
-            'performing_switch_analysis'
-        ]
+    def get_user_input_fields(cls) -> Tuple[str, ...]:
+        """Get fields that require user input (exclude computed fields)"""
+        return _USER_INPUT_FIELDS
     
     @classmethod
-    def get_conditional_required_fields(cls, product_type: str = None) -> List[str]:
+    def get_conditional_required_fields(cls, product_type: str = None) -> Tuple[str, ...]:
         """Get additional required fields based on product type"""
-        conditional = []
-        if not product_type:
-            return conditional
-            
-        if product_type in ['pension', 'sipp']:
-            conditional.extend(['current_age', 'include_taxation', 'tax_band'])
-            
-        if product_type in ['investment_bond', 'unit_trust', 'oeic', 'investment_trust']:
-            conditional.extend(['include_taxation', 'tax_band'])
-            
-        if product_type in ['life_insurance', 'endowment', 'whole_of_life', 'critical_illness_cover']:
-            conditional.extend(['current_age'])
-            
-        return conditional
+        return _CONDITIONAL_BY_PRODUCT.get(product_type, ()) if product_type else ()
     
     @classmethod
     def get_user_input_fields_for_product(cls, product_type: str = None) -> List[str]:
         """Get user input fields filtered by product type"""
-        base_fields = [
-            'valuation_date', 'provider_name', 'product_name', 'product_type',
-            'fund_value', 'surrender_value', 'investment_term_type',
-            'end_date', 'user_input_years', 'user_input_months',
-            'current_age', 'target_age', 'performing_switch_analysis'
-        ]
-        
-        conditional_fields = cls.get_conditional_required_fields(product_type)
-        return base_fields + conditional_fields
+        return [*_PRODUCT_BASE_FIELDS, *cls.get_conditional_required_fields(product_type)]
+    
+    @classmethod
+    def get_examples(cls, field: str) -> List[str]:
+        """Get example inputs for a user field (empty for computed/unknown fields)"""
+        return list(_FIELD_EXAMPLES.get(field, ()))
     
     @classmethod
-    def get_core_required_fields(cls) -> List[str]:
-        """Get list of core required fields (mandatory for all products)"""
-        return [ 'valuation_date', 'provider_name', 'product_name', 'product_type', 'fund_value', 'surrender_value', 'investment_term_type' ]
+    def get_core_required_fields(cls) -> Tuple[str, ...]:
+        """Get core required fields (mandatory for all products)"""
+        return _CORE_REQUIRED_FIELDS
     
     @classmethod
-    def get_term_specific_fields(cls, term_type: str = None) -> List[str]:
+    def get_term_specific_fields(cls, term_type: str = None) -> Tuple[str, ...]:
         """Get required fields based on investment term type"""
-        if not term_type:
-            return []
-            
-        if term_type == 'until':
-            return ['end_date']
-        elif term_type == 'years':
-            return ['user_input_years']  # user_input_months is optional
-        elif term_type == 'age':
-            return ['current_age', 'target_age']
-            
-        return []
+        return _TERM_TYPE_FIELDS.get(term_type, ()) if term_type else ()
     
     # ============================================================================
     # VALIDATION RULES
     # ============================================================================
     
-    @validator('fund_value', 'surrender_value', 'initial_investment_value', pre=True)
-    def convert_currency_fields(cls, v):
-        """Convert numeric values to strings for currency fields"""
-        if v is None:
-            return v
-        return str(v)
-
-    @validator('current_age', 'target_age', 'user_input_years', 'user_input_months', 'data_quality_score', pre=True)  
-    def convert_numeric_fields(cls, v):
-        """Convert numeric values to strings for numeric fields"""
-        if v is None:
-            return v
-        return str(v)
+    # Numeric inputs are kept as strings; conversion happens downstream
+    convert_currency_fields = field_validator(
+        'fund_value', 'surrender_value', mode='before'
+    )(_to_str)
+    
+    convert_numeric_fields = field_validator(
+        'current_age', 'target_age', 'user_input_years', 'user_input_months', mode='before'
+    )(_to_str)
 
-    @validator('include_taxation', 'performing_switch_analysis', pre=True)
+    @field_validator('include_taxation', 'performing_switch_analysis', mode='before')
+    @classmethod
     def convert_boolean_fields(cls, v):
         """Convert boolean values to strings for boolean fields"""
         if v is None:
@@ -291,76 +304,59 @@ class FinancialInputValidationParams(BaseModel):
         if isinstance(v, bool):
             return "yes" if v else "no"
         return str(v)
-
-    @validator('term_years', 'client_tax_rate', 'completion_percentage', pre=True)
-    def convert_decimal_fields(cls, v):
-        """Convert decimal/float values to strings for decimal fields"""
-        if v is None:
-            return v
-        return str(v)
     
-    @validator('product_type')
+    @field_validator('product_type')
+    @classmethod
     def validate_product_type(cls, v):
         """Validate product type against allowed values"""
         if v is None:
             return v
             
         # Convert to lowercase and replace spaces/hyphens
-        normalized = v.lower().strip().replace(' ', '_').replace('-', '_').replace('&', '_')
+        normalized = v.lower().translate(_PRODUCT_TYPE_TRANS)
         
-        # Check against ProductType enum values
-        valid_types = [pt.value for pt in ProductType]
-        if normalized not in valid_types:
-            # Try common aliases
-            aliases = {
-                'stocks_shares_isa': 'stocks_shares_isa',
-                'stocks_and_shares_isa': 'stocks_shares_isa',
-                'personal_pension': 'pension',
-                'workplace_pension': 'pension',
-                'stakeholder_pension': 'pension'
-            }
-            normalized = aliases.get(normalized, normalized)
+        # Check against ProductType enum values, then common aliases
+        if normalized not in _PRODUCT_TYPE_VALUES:
+            normalized = _PRODUCT_ALIASES.get(normalized, normalized)
             
-            if normalized not in valid_types:
-                raise ValueError(f"Invalid product type. Must be one of: {', '.join(valid_types)}")
+            if normalized not in _PRODUCT_TYPE_VALUES:
+                raise ValueError(_PRODUCT_TYPE_ERROR)
                 
         return normalized
     
-    @validator('investment_term_type')
+    @field_validator('investment_term_type')
+    @classmethod
     def validate_investment_term_type(cls, v):
         """Validate investment term type"""
         if v is None:
             return v
             
-        normalized = v.lower().strip()
-        valid_types = [itt.value for itt in InvestmentTermType]
+        normalized = v.lower()
         
-        if normalized not in valid_types:
-            raise ValueError(f"Invalid investment term type. Must be one of: {', '.join(valid_types)}")
+        if normalized not in _TERM_TYPE_VALUES:
+            raise ValueError(_TERM_TYPE_ERROR)
             
         return normalized
     
-    @validator('tax_band')
+    @field_validator('tax_band')
+    @classmethod
     def validate_tax_band(cls, v):
         """Validate tax band"""
         if v is None:
             return v
             
+        # v is already a stripped str (str field, str_strip_whitespace)
         # Handle percentage formats
-        if '%' in str(v):
-            v = str(v).replace('%', '').strip()
-            if v == '20':
-                return TaxBand.BASIC_RATE.value
-            elif v == '40':
-                return TaxBand.HIGHER_RATE.value
-            elif v == '45':
-                return TaxBand.ADDITIONAL_RATE.value
+        if '%' in v:
+            v = v.replace('%', '').strip()
+            band = _TAX_PERCENT_MAP.get(v)
+            if band is not None:
+                return band
                 
-        normalized = str(v).lower().strip().replace(' ', '_')
-        valid_bands = [tb.value for tb in TaxBand]
+        normalized = v.lower().replace(' ', '_')
         
-        if normalized not in valid_bands:
-            raise ValueError(f"Invalid tax band. Must be one of: {', '.join(valid_bands)}")
+        if normalized not in _TAX_BAND_VALUES:
+            raise ValueError(_TAX_BAND_ERROR)
             
         return normalized
     
@@ -368,33 +364,37 @@ class FinancialInputValidationParams(BaseModel):
     # HELPER METHODS
     # ============================================================================
     
-    def get_all_missing_fields(self) -> List[str]:
-        """Get all missing fields based on current values"""
-        missing = []
-        
-        # Check core required fields
-        for field in self.get_core_required_fields():
-            value = getattr(self, field, None)
-            if not value or str(value).strip().lower() in ['', 'none', 'not specified']:
-                missing.append(field)
+    def _field_status(self) -> Tuple[List[str], List[str]]:
+        """
+        Single pass over the user input fields
+        Returns: (missing user input fields, missing required fields in check order)
+        """
+        get = self.__dict__.get  # declared model fields are stored in __dict__
+        is_missing = _is_missing
+        missing_inputs = [field for field in _USER_INPUT_FIELDS if is_missing(get(field))]
+        if not missing_inputs:
+            return missing_inputs, []
         
-        # Check conditional fields based on product type
-        if self.product_type:
-            conditional_fields = self.get_conditional_required_fields(self.product_type)
-            for field in conditional_fields:
-                value = getattr(self, field, None)
-                if not value or str(value).strip().lower() in ['', 'none', 'not specified']:
-                    missing.append(field)
+        missing_set = set(missing_inputs)
+        product_type = get('product_type')
+        term_type = get('investment_term_type')
+        if not product_type and not term_type:
+            # Partially filled form: only the core fields are required so far
+            return missing_inputs, [field for field in _CORE_REQUIRED_FIELDS if field in missing_set]
         
-        # Check term-specific fields
-        if self.investment_term_type:
-            term_fields = self.get_term_specific_fields(self.investment_term_type)
-            for field in term_fields:
-                value = getattr(self, field, None)
-                if not value or str(value).strip().lower() in ['', 'none', 'not specified']:
-                    missing.append(field)
+        # Required = core + product-specific + term-specific (all user input fields)
+        required = _CORE_REQUIRED_FIELDS
+        if product_type:
+            required += _CONDITIONAL_BY_PRODUCT.get(product_type, ())
+        if term_type:
+            required += _TERM_TYPE_FIELDS.get(term_type, ())
         
-        return list(set(missing))  # Remove duplicates
+        missing_required = [field for field in dict.fromkeys(required) if field in missing_set]
+        return missing_inputs, missing_required
+    
+    def get_all_missing_fields(self) -> List[str]:
+        """Get all missing fields based on current values (in check order, no duplicates)"""
+        return self._field_status()[1]
     
     def is_complete(self) -> bool:
         """Check if all required fields are complete"""
@@ -403,21 +403,16 @@ class FinancialInputValidationParams(BaseModel):
     def get_completion_summary(self) -> dict:
         """Get completion summary for user feedback"""
         user_fields = self.get_user_input_fields()
-        completed_fields = []
-        missing_fields = []
-        for field in user_fields:
-            value = getattr(self, field, None)
-            if value and str(value).strip().lower() not in ['', 'none', 'not specified']:
-                completed_fields.append(field)
-            else:
-                missing_fields.append(field)
+        missing_inputs, missing_required = self._field_status()
+        completed_count = len(user_fields) - len(missing_inputs)
         
         return {
             'total_fields': len(user_fields),
-            'completed_fields': len(completed_fields),
-            'missing_fields': len(missing_fields),
-            'completion_percentage': round((len(completed_fields) / len(user_fields)) * 100, 1),
-            'is_complete': self.is_complete(),
-            'missing_field_names': self.get_all_missing_fields()
+            'completed_fields': completed_count,
+            'missing_fields': len(missing_inputs),
+            # Tenths of a percent rounded half-up in integer arithmetic (no float ties
+            # are possible for the 15 user fields, so this matches round(..., 1))
+            'completion_percentage': (completed_count * 2000 // len(user_fields) + 1) // 2 / 10,
+            'is_complete': not missing_required,
+            'missing_field_names': missing_required
         }
-    
@@ -3,22 +3,131 @@ Enhanced validation rules for Phase 1 financial input validation
 File: workflow_system/phases/phase1_financial_input/validation_rules.py
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 import re
 
 from workflow_system.phases.phase1_financial_input.constants import (
     ProductType, InvestmentTermType, TaxBand, SystemLimits,
     PENSION_PRODUCTS, ISA_PRODUCTS, INVESTMENT_PRODUCTS, 
     TAX_EXEMPT_PRODUCTS, AGE_SENSITIVE_PRODUCTS,
-    REQUIRED_FIELDS_BY_PRODUCT, VALIDATION_MESSAGES
+    PRODUCT_CATEGORY, REQUIRED_FIELDS_BY_PRODUCT, VALIDATION_MESSAGES
 )
+from workflow_system.utils.converters import DataTypeConverter
+
+# Shared converter for the parsing helpers (stateless)
+_CONVERTER = DataTypeConverter()
+
+# String values treated as "not provided" (after strip/lower)
+_EMPTY_SENTINELS = frozenset({'', 'none', 'not specified', 'null'})
+
+
+# Parsing helpers: each returns (value, None) or (None, error detail).
+# String inputs are memoized since retries re-submit the same values;
+# other types are converted directly.
+def _convert(converter, value: Any) -> Tuple[Any, Optional[str]]:
+    """Run a DataTypeConverter method, capturing its ValueError"""
+    try:
+        return converter(value), None
+    except ValueError as e:
+        return None, str(e)
+
+
+@lru_cache(maxsize=1024)
+def _convert_str(converter, value: str) -> Tuple[Any, Optional[str]]:
+    """Memoized _convert for string inputs"""
+    return _convert(converter, value)
+
+
+def _is_today(value: Any) -> bool:
+    """Whether a value is the clock-dependent 'today' date keyword"""
+    return type(value) is str and value.lower() == 'today'
+
+
+def _parse_date(value: Any) -> Tuple[Optional[date], Optional[str]]:
+    """Parse a date value ('today' depends on the clock, so it is not cached)"""
+    if type(value) is str and not _is_today(value):
+        return _convert_str(_CONVERTER.to_database_date, value)
+    return _convert(_CONVERTER.to_database_date, value)
+
+
+def _parse_decimal(value: Any) -> Tuple[Optional[Decimal], Optional[str]]:
+    """Parse a currency/decimal value"""
+    if type(value) is str:
+        return _convert_str(_CONVERTER.to_database_decimal, value)
+    return _convert(_CONVERTER.to_database_decimal, value)
+
+
+def _parse_integer(value: Any) -> Tuple[Optional[int], Optional[str]]:
+    """Parse an integer value"""
+    if type(value) is str:
+        return _convert_str(_CONVERTER.to_database_integer, value)
+    return _convert(_CONVERTER.to_database_integer, value)
+
+
+# Surrender/fund value ratio bounds that trigger a warning
+_SURRENDER_HIGH = Decimal('1.2')
+_SURRENDER_LOW = Decimal('0.5')
+
+
+class _ProductProfile(NamedTuple):
+    """Product category flags used by the validators"""
+    is_pension: bool
+    is_isa: bool
+    is_investment: bool
+    is_tax_exempt: bool
+    is_age_sensitive: bool
+
+
+# Profile per known product type; anything else gets _NO_PROFILE
+_PRODUCT_PROFILES: Dict[str, _ProductProfile] = {
+    product: _ProductProfile(
+        is_pension=product in PENSION_PRODUCTS,
+        is_isa=product in ISA_PRODUCTS,
+        is_investment=product in INVESTMENT_PRODUCTS,
+        is_tax_exempt=product in TAX_EXEMPT_PRODUCTS,
+        is_age_sensitive=product in AGE_SENSITIVE_PRODUCTS
+    )
+    for product in (pt.value for pt in ProductType)
+}
+_NO_PROFILE = _ProductProfile(False, False, False, False, False)
+
+
+def _product_profile(product_type: Any) -> _ProductProfile:
+    """Category flags for a product type value"""
+    return _PRODUCT_PROFILES.get(product_type, _NO_PROFILE)
+
+
+# Label per category with product-specific required fields
+# (insurance products are only checked against the common fields)
+_REQUIRED_CATEGORY_LABELS = {'pension': 'pension', 'isa': 'ISA', 'investment': 'investment'}
+
+# Required-field checks as (field, VALIDATION_MESSAGES key, default message)
+_RequiredCheck = Tuple[str, str, str]
+
+_COMMON_REQUIRED_CHECKS: Tuple[_RequiredCheck, ...] = tuple(
+    (field, f"{field}_required", f"{field} is required")
+    for field in REQUIRED_FIELDS_BY_PRODUCT.get('common', [])
+)
+
+# Product type value -> its category's required-field checks
+_PRODUCT_REQUIRED_CHECKS: Dict[str, Tuple[_RequiredCheck, ...]] = {
+    product: tuple(
+        (field, f"{field}_required", f"{field} is required for {_REQUIRED_CATEGORY_LABELS[category]} products")
+        for field in REQUIRED_FIELDS_BY_PRODUCT.get(category, [])
+    )
+    for product, category in PRODUCT_CATEGORY.items()
+    if category in _REQUIRED_CATEGORY_LABELS
+}
 
 
 class Phase1ValidationRules:
     """Comprehensive validation rules for Phase 1 financial input"""
     
+    __slots__ = ('validation_errors', 'validation_warnings')
+    
     def __init__(self):
         self.validation_errors = []
         self.validation_warnings = []
@@ -28,13 +137,13 @@ class Phase1ValidationRules:
         self.validation_errors.clear()
         self.validation_warnings.clear()
     
-    def get_errors(self) -> List[str]:
+    def get_errors(self) -> Tuple[str, ...]:
         """Get validation errors"""
-        return self.validation_errors.copy()
+        return tuple(self.validation_errors)
     
-    def get_warnings(self) -> List[str]:
+    def get_warnings(self) -> Tuple[str, ...]:
         """Get validation warnings"""
-        return self.validation_warnings.copy()
+        return tuple(self.validation_warnings)
     
     def validate_required_fields(self, params: Dict[str, Any], 
                                 product_type: Optional[str] = None) -> bool:
@@ -43,55 +152,31 @@ class Phase1ValidationRules:
         Returns: True if all required fields present
         """
         is_valid = True
-        
-        # Common required fields
-        common_fields = REQUIRED_FIELDS_BY_PRODUCT.get('common', [])
-        for field in common_fields:
-            if not self._is_field_present(params, field):
-                self.validation_errors.append(
-                    VALIDATION_MESSAGES.get(f"{field}_required", f"{field} is required")
-                )
+        err = self.validation_errors.append
+        vmsg = VALIDATION_MESSAGES.get
+        is_present = self._is_field_present
+        
+        # Common fields, then the product category's fields
+        checks = _COMMON_REQUIRED_CHECKS + _PRODUCT_REQUIRED_CHECKS.get(product_type, ())
+        for field, message_key, default in checks:
+            if not is_present(params, field):
+                err(vmsg(message_key, default))
                 is_valid = False
         
-        # Product-specific required fields
-        if product_type:
-            if product_type in PENSION_PRODUCTS:
-                pension_fields = REQUIRED_FIELDS_BY_PRODUCT.get('pension', [])
-                for field in pension_fields:
-                    if not self._is_field_present(params, field):
-                        self.validation_errors.append(
-                            VALIDATION_MESSAGES.get(f"{field}_required", f"{field} is required for pension products")
-                        )
-                        is_valid = False
-            
-            elif product_type in ISA_PRODUCTS:
-                isa_fields = REQUIRED_FIELDS_BY_PRODUCT.get('isa', [])
-                for field in isa_fields:
-                    if not self._is_field_present(params, field):
-                        self.validation_errors.append(
-                            VALIDATION_MESSAGES.get(f"{field}_required", f"{field} is required for ISA products")
-                        )
-                        is_valid = False
-            
-            elif product_type in INVESTMENT_PRODUCTS:
-                investment_fields = REQUIRED_FIELDS_BY_PRODUCT.get('investment', [])
-                for field in investment_fields:
-                    if not self._is_field_present(params, field):
-                        self.validation_errors.append(
-                            VALIDATION_MESSAGES.get(f"{field}_required", f"{field} is required for investment products")
-                        )
-                        is_valid = False
-        
         return is_valid
     
     def validate_date_fields(self, params: Dict[str, Any]) -> bool:
         """Validate all date fields"""
         is_valid = True
+        err = self.validation_errors.append
+        vmsg = VALIDATION_MESSAGES.get
         
         # Validate valuation_date
         valuation_date = params.get('valuation_date')
         if valuation_date:
-            parsed_valuation = self._validate_date_format(valuation_date, 'valuation_date')
+            parsed_valuation, error = _parse_date(valuation_date)
+            if error is not None:
+                err(f"Invalid date format for valuation_date: {error}")
             if parsed_valuation is None:
                 is_valid = False
         else:
@@ -100,11 +185,13 @@ class Phase1ValidationRules:
         # Validate end_date
         end_date = params.get('end_date')
         if end_date:
-            parsed_end = self._validate_date_format(end_date, 'end_date')
+            parsed_end, error = _parse_date(end_date)
+            if error is not None:
+                err(f"Invalid date format for end_date: {error}")
             if parsed_end is None:
                 is_valid = False
             elif parsed_valuation and parsed_end <= parsed_valuation:
-                self.validation_errors.append(VALIDATION_MESSAGES.get('end_date_future'))
+                err(vmsg('end_date_future'))
                 is_valid = False
         
         return is_valid
@@ -112,25 +199,30 @@ class Phase1ValidationRules:
     def validate_currency_fields(self, params: Dict[str, Any]) -> bool:
         """Validate all currency/monetary fields"""
         is_valid = True
+        err = self.validation_errors.append
+        warn = self.validation_warnings.append
+        vmsg = VALIDATION_MESSAGES.get
         
         currency_fields = ['fund_value', 'surrender_value']
         
         for field in currency_fields:
             value_str = params.get(field)
             if value_str:
-                decimal_value = self._validate_currency_amount(value_str, field)
+                decimal_value, error = _parse_decimal(value_str)
+                if error is not None:
+                    err(f"Invalid amount for {field}: {error}")
                 if decimal_value is None:
                     is_valid = False
                 else:
                     # Range validation
                     if decimal_value <= 0:
-                        self.validation_errors.append(VALIDATION_MESSAGES.get(f"{field}_positive"))
+                        err(vmsg(f"{field}_positive"))
                         is_valid = False
                     elif decimal_value > SystemLimits.MAX_FUND_VALUE:
-                        self.validation_errors.append(VALIDATION_MESSAGES.get(f"{field}_maximum"))
+                        err(vmsg(f"{field}_maximum"))
                         is_valid = False
                     elif decimal_value < SystemLimits.MIN_FUND_VALUE:
-                        self.validation_warnings.append(f"{field} is quite low - please verify")
+                        warn(f"{field} is quite low - please verify")
         
         # Cross-field validation
         fund_value_str = params.get('fund_value')
@@ -138,62 +230,72 @@ class Phase1ValidationRules:
         
         if fund_value_str and surrender_value_str:
             try:
-                fund_val = self._parse_currency(fund_value_str)
-                surrender_val = self._parse_currency(surrender_value_str)
+                fund_val = _parse_decimal(fund_value_str)[0]
+                surrender_val = _parse_decimal(surrender_value_str)[0]
                 
                 if fund_val and surrender_val:
                     ratio = surrender_val / fund_val
-                    if ratio > Decimal('1.2'):
-                        self.validation_warnings.append(VALIDATION_MESSAGES.get('surrender_value_realistic'))
-                    elif ratio < Decimal('0.5'):
-                        self.validation_warnings.append("Surrender value is very low - high exit penalties may apply")
+                    if ratio > _SURRENDER_HIGH:
+                        warn(vmsg('surrender_value_realistic'))
+                    elif ratio < _SURRENDER_LOW:
+                        warn("Surrender value is very low - high exit penalties may apply")
             except Exception:
                 pass  # Already validated individually
         
         return is_valid
     
-    def validate_age_fields(self, params: Dict[str, Any]) -> bool:
+    def validate_age_fields(self, params: Dict[str, Any],
+                            profile: Optional[_ProductProfile] = None) -> bool:
         """Validate age-related fields"""
         is_valid = True
+        err = self.validation_errors.append
+        warn = self.validation_warnings.append
+        vmsg = VALIDATION_MESSAGES.get
         
         current_age = params.get('current_age')
         target_age = params.get('target_age')
-        product_type = params.get('product_type')
+        if profile is None:
+            profile = _product_profile(params.get('product_type'))
         
-        # Validate current_age
+        # Validate current_age; the parsed value is reused for target_age
+        age_val = None
         if current_age:
-            age_val = self._validate_integer_field(current_age, 'current_age')
+            age_val, error = _parse_integer(current_age)
+            if error is not None:
+                err(f"Invalid number for current_age: {error}")
             if age_val is None:
                 is_valid = False
             else:
                 if age_val < SystemLimits.MIN_AGE:
-                    self.validation_errors.append(VALIDATION_MESSAGES.get('age_minimum'))
+                    err(vmsg('age_minimum'))
                     is_valid = False
                 elif age_val > SystemLimits.MAX_AGE:
-                    self.validation_errors.append(VALIDATION_MESSAGES.get('age_maximum'))
+                    err(vmsg('age_maximum'))
                     is_valid = False
         
         # Validate target_age
         if target_age:
-            target_val = self._validate_integer_field(target_age, 'target_age')
+            target_val, error = _parse_integer(target_age)
+            if error is not None:
+                err(f"Invalid number for target_age: {error}")
             if target_val is None:
                 is_valid = False
             else:
-                if current_age:
-                    current_val = self._validate_integer_field(current_age, 'current_age')
-                    if current_val and target_val <= current_val:
-                        self.validation_errors.append(VALIDATION_MESSAGES.get('target_age_greater'))
-                        is_valid = False
+                if age_val and target_val <= age_val:
+                    err(vmsg('target_age_greater'))
+                    is_valid = False
                 
                 # Pension-specific age validation
-                if product_type in PENSION_PRODUCTS and target_val < SystemLimits.MIN_PENSION_ACCESS_AGE:
-                    self.validation_warnings.append(VALIDATION_MESSAGES.get('pension_access_age'))
+                if profile.is_pension and target_val < SystemLimits.MIN_PENSION_ACCESS_AGE:
+                    warn(vmsg('pension_access_age'))
         
         return is_valid
     
     def validate_term_fields(self, params: Dict[str, Any]) -> bool:
         """Validate investment term fields"""
         is_valid = True
+        err = self.validation_errors.append
+        vmsg = VALIDATION_MESSAGES.get
         
         term_type = params.get('investment_term_type')
         
@@ -202,86 +304,99 @@ class Phase1ValidationRules:
             months = params.get('user_input_months')
             
             if years:
-                years_val = self._validate_integer_field(years, 'user_input_years')
+                years_val, error = _parse_integer(years)
+                if error is not None:
+                    err(f"Invalid number for user_input_years: {error}")
                 if years_val is None:
                     is_valid = False
                 elif years_val > SystemLimits.MAX_TERM_YEARS:
-                    self.validation_errors.append(VALIDATION_MESSAGES.get('term_years_maximum'))
+                    err(vmsg('term_years_maximum'))
                     is_valid = False
                 elif years_val == 0 and not months:
-                    self.validation_errors.append(VALIDATION_MESSAGES.get('term_years_minimum'))
+                    err(vmsg('term_years_minimum'))
                     is_valid = False
             
             if months:
-                months_val = self._validate_integer_field(months, 'user_input_months')
+                months_val, error = _parse_integer(months)
+                if error is not None:
+                    err(f"Invalid number for user_input_months: {error}")
                 if months_val is None:
                     is_valid = False
                 elif months_val < 0 or months_val > 11:
-                    self.validation_errors.append("Months must be between 0 and 11")
+                    err("Months must be between 0 and 11")
                     is_valid = False
         
         elif term_type == InvestmentTermType.UNTIL.value:
             end_date = params.get('end_date')
             if not end_date:
-                self.validation_errors.append("End date is required when term type is 'until'")
+                err("End date is required when term type is 'until'")
                 is_valid = False
         
         elif term_type == InvestmentTermType.AGE.value:
             if not params.get('current_age'):
-                self.validation_errors.append("Current age is required when term type is 'age'")
+                err("Current age is required when term type is 'age'")
                 is_valid = False
             if not params.get('target_age'):
-                self.validation_errors.append("Target age is required when term type is 'age'")
+                err("Target age is required when term type is 'age'")
                 is_valid = False
         
         return is_valid
     
-    def validate_tax_fields(self, params: Dict[str, Any]) -> bool:
+    def validate_tax_fields(self, params: Dict[str, Any],
+                            profile: Optional[_ProductProfile] = None) -> bool:
         """Validate tax-related fields with ISA awareness"""
         is_valid = True
+        err = self.validation_errors.append
+        warn = self.validation_warnings.append
         
-        product_type = params.get('product_type')
         include_taxation = params.get('include_taxation')
         tax_band = params.get('tax_band')
+        if profile is None:
+            profile = _product_profile(params.get('product_type'))
         
-        if product_type in ['isa', 'stocks_shares_isa']:
+        if profile.is_isa:
             if include_taxation:
-                self.validation_warnings.append("ISAs are tax-exempt - tax analysis not needed (ignoring tax settings)")
+                warn("ISAs are tax-exempt - tax analysis not needed (ignoring tax settings)")
             return True
         
-        if product_type in ['investment_bond', 'unit_trust', 'oeic', 'investment_trust'] and include_taxation is False:
-            self.validation_warnings.append("Investment products usually benefit from tax analysis")
+        if profile.is_investment and include_taxation is False:
+            warn("Investment products usually benefit from tax analysis")
         
-        if product_type in ['pension', 'sipp'] and include_taxation is False:
-            self.validation_warnings.append("Pension products usually benefit from tax analysis")
+        if profile.is_pension and include_taxation is False:
+            warn("Pension products usually benefit from tax analysis")
         
-        # Validate tax band if tax analysis included (and not ISA)
-        if include_taxation and not tax_band and product_type not in ['isa', 'stocks_shares_isa']:
-            self.validation_errors.append("Tax band must be specified when including tax analysis")
+        # Validate tax band if tax analysis included (ISAs returned above)
+        if include_taxation and not tax_band:
+            err("Tax band must be specified when including tax analysis")
             is_valid = False
         
         return is_valid
     
-    def validate_product_specific_rules(self, params: Dict[str, Any]) -> bool:
+    def validate_product_specific_rules(self, params: Dict[str, Any],
+                                        profile: Optional[_ProductProfile] = None) -> bool:
         """Validate product-specific business rules"""
         is_valid = True
+        err = self.validation_errors.append
+        warn = self.validation_warnings.append
         
         product_type = params.get('product_type')
         
         if not product_type:
             return is_valid
+        if profile is None:
+            profile = _product_profile(product_type)
         
         # Age requirements for age-sensitive products
-        if product_type in AGE_SENSITIVE_PRODUCTS:
+        if profile.is_age_sensitive:
             if not params.get('current_age'):
-                self.validation_errors.append(f"Age is required for {product_type} products")
+                err(f"Age is required for {product_type} products")
                 is_valid = False
         
         # Tax requirements for taxable products
-        if product_type not in TAX_EXEMPT_PRODUCTS:
+        if not profile.is_tax_exempt:
             include_tax = params.get('include_taxation')
             if include_tax is None:
-                self.validation_warnings.append(f"Consider including tax analysis for {product_type} products")
+                warn(f"Consider including tax analysis for {product_type} products")
         
         return is_valid
     
@@ -290,24 +405,34 @@ class Phase1ValidationRules:
         Run all validation rules
         Returns: (is_valid, errors, warnings)
         """
-        self.clear_errors()
+        # Fresh lists rather than clear_errors(): they are returned as-is,
+        # so a later run must not clear what an earlier caller holds
+        self.validation_errors = []
+        self.validation_warnings = []
         
         product_type = params.get('product_type')
+        # Resolve the product's category flags once for every validator
+        profile = _product_profile(product_type)
+        
+        # Required fields always run; every other category only reports on
+        # fields that are set, so it is skipped (valid, no messages) while
+        # its inputs are still missing, e.g. early in a session
+        get = params.get
+        is_valid = self.validate_required_fields(params, product_type)
+        if get('valuation_date') or get('end_date'):
+            is_valid = self.validate_date_fields(params) and is_valid
+        if get('fund_value') or get('surrender_value'):
+            is_valid = self.validate_currency_fields(params) and is_valid
+        if get('current_age') or get('target_age'):
+            is_valid = self.validate_age_fields(params, profile) and is_valid
+        if get('investment_term_type'):
+            is_valid = self.validate_term_fields(params) and is_valid
+        if get('include_taxation') is not None:
+            is_valid = self.validate_tax_fields(params, profile) and is_valid
+        if product_type:
+            is_valid = self.validate_product_specific_rules(params, profile) and is_valid
         
-        # Run all validation categories
-        results = [
-            self.validate_required_fields(params, product_type),
-            self.validate_date_fields(params),
-            self.validate_currency_fields(params),
-            self.validate_age_fields(params),
-            self.validate_term_fields(params),
-            self.validate_tax_fields(params),
-            self.validate_product_specific_rules(params)
-        ]
-        
-        is_valid = all(results)
-        
-        return is_valid, self.get_errors(), self.get_warnings()
+        return is_valid, self.validation_errors, self.validation_warnings
     
     # Helper methods
     def _is_field_present(self, params: Dict[str, Any], field: str) -> bool:
@@ -315,48 +440,10 @@ class Phase1ValidationRules:
         value = params.get(field)
         if value is None:
             return False
-        if isinstance(value, str) and value.strip().lower() in ['', 'none', 'not specified', 'null']:
-            return False
+        if isinstance(value, str):
+            # Only non-empty strings need the normalised sentinel lookup
+            return bool(value) and value.strip().lower() not in _EMPTY_SENTINELS
         return True
-    
-    def _validate_date_format(self, date_str: str, field_name: str) -> Optional[date]:
-        """Validate date format and return parsed date"""
-        try:
-            from workflow_system.utils.converters import DataTypeConverter
-            converter = DataTypeConverter()
-            return converter.to_database_date(date_str)
-        except ValueError as e:
-            self.validation_errors.append(f"Invalid date format for {field_name}: {str(e)}")
-            return None
-    
-    def _validate_currency_amount(self, amount_str: str, field_name: str) -> Optional[Decimal]:
-        """Validate currency amount and return parsed decimal"""
-        try:
-            from workflow_system.utils.converters import DataTypeConverter
-            converter = DataTypeConverter()
-            return converter.to_database_decimal(amount_str)
-        except ValueError as e:
-            self.validation_errors.append(f"Invalid amount for {field_name}: {str(e)}")
-            return None
-    
-    def _validate_integer_field(self, value_str: str, field_name: str) -> Optional[int]:
-        """Validate integer field and return parsed value"""
-        try:
-            from workflow_system.utils.converters import DataTypeConverter
-            converter = DataTypeConverter()
-            return converter.to_database_integer(value_str)
-        except ValueError as e:
-            self.validation_errors.append(f"Invalid number for {field_name}: {str(e)}")
-            return None
-    
-    def _parse_currency(self, amount_str: str) -> Optional[Decimal]:
-        """Parse currency string to decimal"""
-        try:
-            from workflow_system.utils.converters import DataTypeConverter
-            converter = DataTypeConverter()
-            return converter.to_database_decimal(amount_str)
-        except ValueError:
-            return None
 
 
 # Standalone validation functions for backward compatibility
@@ -365,8 +452,23 @@ def validate_comprehensive_phase1(params: Dict[str, Any]) -> Dict[str, Any]:
     Comprehensive validation for Phase 1 parameters
     Returns validation result dictionary
     """
-    validator = Phase1ValidationRules()
-    is_valid, errors, warnings = validator.validate_all_fields(params)
+    validated = None
+    # 'today' resolves against the clock, so those results are never cached
+    if not any(_is_today(value) for value in params.values()):
+        try:
+            # Value types are part of the key: False and 0 (or True and 1)
+            # compare equal but validate differently
+            key = tuple((field, type(value), value) for field, value in sorted(params.items()))
+            is_valid, errors, warnings = _validate_params_cached(key)
+            validated = is_valid, list(errors), list(warnings)
+        except TypeError:
+            # Unhashable values (lists, dicts): validate without the cache
+            pass
+    
+    if validated is None:
+        validator = Phase1ValidationRules()
+        validated = validator.validate_all_fields(params)
+    is_valid, errors, warnings = validated
     
     return {
         'is_valid': is_valid,
@@ -377,6 +479,15 @@ def validate_comprehensive_phase1(params: Dict[str, Any]) -> Dict[str, Any]:
         'validation_summary': _create_validation_summary(is_valid, errors, warnings)
     }
 
+
+@lru_cache(maxsize=512)
+def _validate_params_cached(key: tuple) -> tuple:
+    """Validate a canonical (field, type, value) params key; returns (is_valid, errors, warnings)"""
+    validator = Phase1ValidationRules()
+    is_valid, errors, warnings = validator.validate_all_fields({field: value for field, _, value in key})
+    return is_valid, tuple(errors), tuple(warnings)
+
+
 def _create_validation_summary(is_valid: bool, errors: List[str], warnings: List[str]) -> str:
     """Create human-readable validation summary"""
     if is_valid and not warnings:
@@ -8,20 +8,24 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+_now = datetime.datetime.now
+_UTC = datetime.timezone.utc
+
 
 def generate_report_workflow(params: Dict[str, Any]) -> Dict[str, Any]:
     """Generate a user report"""
-    logger.info(f"Executing report generation workflow with params: {params}")
+    logger.info("Executing report generation workflow with params: %s", params)
     user_name = params["user_name"]
     report_type = params["report_type"]
     
-    chart_data = [{"month": i+1, "value": len(user_name) * (i+1) * 10} for i in range(6)]
+    base_value = len(user_name) * 10
+    chart_data = [{"month": month, "value": base_value * month} for month in range(1, 7)]
     
     result = {
         "status": "completed",
         "report_title": f"{report_type.title()} Report for {user_name}",
         "chart_data": chart_data,
-        "generated_at": datetime.datetime.utcnow().isoformat(),
+        "generated_at": _now(_UTC).isoformat(timespec='seconds'),
         "workflow_type": "report_generation",
         "metadata": {
             "user_name": user_name,
@@ -30,5 +34,5 @@ def generate_report_workflow(params: Dict[str, Any]) -> Dict[str, Any]:
         }
     }
     
-    logger.info(f"Report generation completed successfully for {user_name}")
+    logger.info("Report generation completed successfully for %s", user_name)
     return result
\ No newline at end of file
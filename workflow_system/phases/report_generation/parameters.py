@@ -2,18 +2,37 @@
 Parameters for Report Generation workflow
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
+
+from workflow_system.utils.schema import field_examples_hook
+
+# Example inputs per field, shared by prompt building (get_examples) and
+# the JSON schema
+_FIELD_EXAMPLES = {
+    'user_name': ("Alice", "John", "Sarah"),
+    'report_type': ("monthly", "quarterly", "annual", "daily", "weekly"),
+}
+
 
 class GenerateReportParams(BaseModel):
     """Parameters for report generation workflow"""
+
+    model_config = ConfigDict(
+        extra='ignore', frozen=True, validate_assignment=False,
+        json_schema_extra=field_examples_hook(_FIELD_EXAMPLES)
+    )
+
     user_name: Optional[str] = Field(
         default=None,
-        description="Extract the user's name (look for names like 'Alice', 'John', 'for user X')",
-        examples=["Alice", "John", "Sarah"]
+        description="Extract the user's name (look for names like 'Alice', 'John', 'for user X')"
     )
     report_type: Optional[str] = Field(
         default=None,
-        description="Extract report type (monthly, quarterly, annual, daily, weekly)",
-        examples=["monthly", "quarterly", "annual", "daily", "weekly"]
-    )
\ No newline at end of file
+        description="Extract report type (monthly, quarterly, annual, daily, weekly)"
+    )
+
+    @classmethod
+    def get_examples(cls, field: str) -> List[str]:
+        """Get example inputs for a field (empty for unknown fields)"""
+        return list(_FIELD_EXAMPLES.get(field, ()))
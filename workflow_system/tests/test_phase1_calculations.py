@@ -0,0 +1,71 @@
+"""
+Tests for the Phase 1 calculations.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from ..phases.phase1_financial_input.calculations import (
+    ReadinessResult,
+    assess_data_readiness,
+    assess_data_readiness_batch,
+    calculate_investment_projection,
+)
+
+
+def _project(term_years):
+    return calculate_investment_projection({
+        'fund_value': '50000',
+        'term_years': term_years,
+        'product_type': 'pension',
+    })
+
+
+def test_projection_compound_growth():
+    """50,000 at the 5% pension rate for 5 years"""
+    result = _project('5')
+    assert result['projection_available'] is True
+    assert result['growth_rate_used'] == Decimal('0.05')
+    assert result['projected_value'] == Decimal('63814.08')
+    assert result['real_value'] == Decimal('56402.35')
+    assert result['total_growth'] == Decimal('13814.08')
+
+
+def test_projection_fractional_term():
+    result = _project('2.5')
+    assert result['projection_available'] is True
+    assert result['projected_value'] == Decimal('56486.32')
+    assert result['real_value'] == Decimal('53104.78')
+
+
+@pytest.mark.parametrize('term_years', ['-1', '-0.5'])
+def test_projection_non_positive_term(term_years):
+    result = _project(term_years)
+    assert result['projection_available'] is False
+    assert result['error'] == "Projection calculation failed: Years must be positive"
+
+
+def test_projection_zero_term_is_insufficient_data():
+    result = _project(0)
+    assert result == {
+        'projection_available': False,
+        'error': "Insufficient data for projection calculation",
+    }
+
+
+def test_assess_data_readiness_batch_matches_per_row():
+    rows = [
+        {'product_type': 'pension', 'fund_value': '£50,000', 'surrender_value': '£45,000',
+         'valuation_date': '01/01/2024', 'provider_name': 'Aviva', 'product_name': 'PP',
+         'investment_term_type': 'age', 'current_age': 45, 'target_age': 65,
+         'tax_band': 'basic_rate_20', 'include_taxation': True},
+        {'product_type': 'isa', 'fund_value': 1000, 'provider_name': 'none'},
+        {},
+    ]
+    results = assess_data_readiness_batch(rows)
+
+    assert len(results) == len(rows)
+    assert all(type(result) is ReadinessResult for result in results)
+    assert results == [assess_data_readiness(row) for row in rows]
+    assert results[0].ready_for_next_phase != results[2].ready_for_next_phase
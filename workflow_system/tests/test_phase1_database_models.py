@@ -0,0 +1,79 @@
+"""
+Tests for the Phase 1 database models.
+"""
+
+from dataclasses import fields as dataclass_fields
+from datetime import date, datetime
+from decimal import Decimal
+
+from ..phases.phase1_financial_input import database_models
+from ..phases.phase1_financial_input.database_models import FinancialInputValidationRecord
+from ..models.database import DatabaseField
+
+_FULL_VALUES = {
+    'valuation_date': date(2024, 1, 1),
+    'provider_name': 'Aviva',
+    'product_name': 'Personal Pension Plan',
+    'product_type': 'pension',
+    'fund_value': Decimal('50000.00'),
+    'surrender_value': Decimal('48000.00'),
+    'investment_term_type': 'years',
+    'end_date': date(2034, 1, 1),
+    'user_input_years': 10,
+    'user_input_months': 6,
+    'current_age': 45,
+    'target_age': 65,
+    'term_years': Decimal('10.5000'),
+    'initial_investment_value': Decimal('48000.00'),
+    'analysis_mode': 'switching',
+    'include_taxation': True,
+    'tax_band': 'basic_rate_20',
+    'client_tax_rate': Decimal('0.2000'),
+    'performing_switch_analysis': True,
+    'data_quality_score': 90,
+    'completion_percentage': Decimal('95.00'),
+    'validation_status': 'validated',
+    'missing_fields': '[]',
+    'validation_errors': None,
+}
+
+
+def test_field_specs_cover_every_record_column():
+    record_fields = [f.name for f in dataclass_fields(FinancialInputValidationRecord)]
+    spec_names = [name for name, _ in database_models._FIELD_SPECS]
+    columns = database_models._DATABASE_SCHEMA['financial_input_validation']['columns']
+
+    assert spec_names == [name for name in record_fields if name != 'id']
+    for name, sql_type in database_models._FIELD_SPECS:
+        assert columns[name].startswith(sql_type)
+
+
+def test_to_database_record_fills_every_field():
+    created = datetime(2024, 1, 1, 9, 30)
+    record = FinancialInputValidationRecord(
+        id=7, session_id='s', created_at=created, updated_at=created, **_FULL_VALUES
+    )
+    fields = record.to_database_record({}).fields
+
+    assert list(fields) == ['id'] + [name for name, _ in database_models._FIELD_SPECS]
+    assert fields['id'] == DatabaseField('id', 7, 'INTEGER', False, True)
+    expected = dict(_FULL_VALUES, session_id='s', created_at=created, updated_at=created)
+    for name, sql_type in database_models._FIELD_SPECS:
+        field = fields[name]
+        assert field == DatabaseField(name, expected[name], sql_type)
+        assert type(field.value) is type(expected[name])
+
+
+def test_to_database_record_defaults():
+    before = datetime.utcnow()
+    fields = FinancialInputValidationRecord.from_params({'provider_name': 'Aviva'}, 's').to_database_record({}).fields
+
+    assert 'id' not in fields
+    assert fields['session_id'].value == 's'
+    assert fields['provider_name'].value == 'Aviva'
+    for name, _ in database_models._FIELD_SPECS:
+        if name not in ('session_id', 'provider_name', 'created_at', 'updated_at'):
+            assert fields[name].value is None, name
+    assert isinstance(fields['created_at'].value, datetime)
+    assert fields['created_at'].value >= before
+    assert fields['updated_at'].value == fields['created_at'].value
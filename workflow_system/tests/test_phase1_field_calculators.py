@@ -0,0 +1,48 @@
+"""
+Tests for the Phase 1 field calculators.
+"""
+
+from ..phases.phase1_financial_input.field_calculators import Phase1FieldCalculator
+
+_RECORDS = [
+    {'investment_term_type': 'until', 'valuation_date': '01/01/2024', 'end_date': '01/01/2020',
+     'product_type': 'pension', 'fund_value': '50000', 'tax_band': 'basic_rate_20'},
+    {'investment_term_type': 'years', 'user_input_years': 3, 'user_input_months': 7,
+     'product_type': 'isa', 'fund_value': '20000', 'surrender_value': '19000',
+     'valuation_date': '01/01/2024', 'provider_name': 'Aviva', 'product_name': 'ISA'},
+    {'investment_term_type': 'age', 'current_age': 40, 'target_age': 67,
+     'product_type': 'unit_trust', 'tax_band': 'higher_rate_40', 'include_taxation': True},
+    {'investment_term_type': 'years', 'product_name': 'Transfer plan'},
+]
+
+
+def _calculate_each(records, required_fields=None):
+    calculator = Phase1FieldCalculator()
+    return [calculator.calculate_all_fields(record, required_fields) for record in records]
+
+
+def test_calculate_batch_matches_calculate_all_fields():
+    assert Phase1FieldCalculator().calculate_batch(_RECORDS) == _calculate_each(_RECORDS)
+
+
+def test_calculate_batch_with_required_fields():
+    required = ['fund_value', 'current_age']
+    results = Phase1FieldCalculator().calculate_batch(_RECORDS, required)
+    assert results == _calculate_each(_RECORDS, required)
+    assert results != _calculate_each(_RECORDS)
+
+
+def test_calculate_batch_errors_are_per_record():
+    """get_errors() after a batch holds only the last record's errors"""
+    calculator = Phase1FieldCalculator()
+    results = calculator.calculate_batch(_RECORDS)
+
+    last = Phase1FieldCalculator()
+    last.calculate_all_fields(_RECORDS[-1])
+    assert calculator.get_errors() == last.get_errors()
+
+    first = Phase1FieldCalculator()
+    first.calculate_all_fields(_RECORDS[0])
+    assert first.get_errors()
+    assert not set(first.get_errors()) & set(calculator.get_errors())
+    assert results[0]['validation_errors'] is not None
@@ -0,0 +1,108 @@
+"""
+Tests for the Phase 1 workflow implementation.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from ..phases.phase1_financial_input import implementation
+from ..phases.phase1_financial_input.implementation import (
+    Phase1ValidationResult,
+    financial_input_validation_batch,
+    financial_input_validation_workflow,
+)
+from ..utils.converters import DataTypeConverter
+
+_TIMESTAMP_KEYS = frozenset(('completed_at', 'created_at', 'updated_at'))
+
+_VALID = {
+    'valuation_date': '01/01/2024', 'provider_name': 'Aviva',
+    'product_name': 'Personal Pension Plan', 'product_type': 'pension',
+    'fund_value': '£50,000', 'surrender_value': '£48,000',
+    'investment_term_type': 'age', 'current_age': '45', 'target_age': '65',
+    'include_taxation': 'yes', 'tax_band': 'basic_rate_20',
+}
+_INVALID = {**_VALID, 'fund_value': 'abc', 'current_age': '12', 'target_age': '10'}
+
+
+def _without_timestamps(value):
+    """Copy of a result with run-time timestamps blanked out"""
+    if isinstance(value, dict):
+        return {
+            key: None if key in _TIMESTAMP_KEYS else _without_timestamps(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_without_timestamps(item) for item in value]
+    return value
+
+
+def test_batch_matches_single_workflow():
+    records = [_VALID, _INVALID, dict(_VALID, provider_name='Standard Life')]
+    results = financial_input_validation_batch([dict(r) for r in records], session_id='s')
+
+    assert len(results) == len(records)
+    for record, result in zip(records, results):
+        expected = financial_input_validation_workflow(dict(record), session_id='s')
+        assert _without_timestamps(result) == _without_timestamps(expected)
+    # The invalid middle record's errors must not leak into the first result
+    assert results[0]['validation_results']['validation_errors'] == []
+    assert results[1]['validation_results']['validation_errors']
+
+
+def test_batch_results_keep_their_own_errors():
+    """The shared processor must not clear or extend earlier records' lists"""
+    results = financial_input_validation_batch([dict(_INVALID), dict(_VALID), dict(_INVALID)])
+    first = results[0]['validation_results']
+    expected = financial_input_validation_workflow(dict(_INVALID))['validation_results']
+
+    assert first['validation_errors']
+    assert first == expected
+    assert results[1]['validation_results']['validation_errors'] == []
+
+
+def test_batch_as_objects():
+    records = [_VALID, _INVALID]
+    results = financial_input_validation_batch([dict(r) for r in records], as_dicts=False)
+
+    assert all(isinstance(result, Phase1ValidationResult) for result in results)
+    dicts = financial_input_validation_batch([dict(r) for r in records])
+    assert [_without_timestamps(r.to_dict()) for r in results] == _without_timestamps(dicts)
+
+
+def _decimal_cents(amount):
+    value = DataTypeConverter.to_database_decimal(amount)
+    return value * 100 if value is not None else None
+
+
+@pytest.mark.parametrize('amount', [
+    '£0.5', '£1,000.50', '1,2345', '50k', '-100', '0', ' £ 12.3 ', '1,000,000',
+    # MIN_FUND_VALUE / MAX_FUND_VALUE and their 1p neighbours
+    '£999.99', '£1,000', '1000.00', '£1,000.01',
+    '£49,999,999.99', '50,000,000', '£50,000,000.01',
+    50000, 0.5, 1000, 49999999.99, Decimal('1000.01'), None, '',
+])
+def test_amount_in_cents_matches_decimal_converter(amount):
+    cents = implementation._amount_in_cents(amount, DataTypeConverter.to_database_decimal)
+    expected = _decimal_cents(amount)
+    assert cents == expected
+    if isinstance(amount, str) and implementation._AMOUNT_RE.match(amount):
+        assert type(cents) is int
+
+
+@pytest.mark.parametrize('amount, accepted', [
+    ('£999.99', False), ('£1,000', True), ('£1,000.01', True),
+    ('£49,999,999.99', True), ('£50,000,000', True), ('£50,000,000.01', False),
+])
+def test_amount_in_cents_fund_bounds(amount, accepted):
+    cents = implementation._amount_in_cents(amount, DataTypeConverter.to_database_decimal)
+    assert (implementation._MIN_FUND_CENTS <= cents <= implementation._MAX_FUND_CENTS) is accepted
+
+
+@pytest.mark.parametrize('amount', ['abc', '£1.234.5'])
+def test_amount_in_cents_invalid(amount):
+    with pytest.raises(ValueError):
+        implementation._amount_in_cents(amount, DataTypeConverter.to_database_decimal)
+    with pytest.raises(ValueError):
+        DataTypeConverter.to_database_decimal(amount)
@@ -0,0 +1,49 @@
+"""
+Tests for the Phase 1 validation rules.
+"""
+
+import datetime
+
+from ..phases.phase1_financial_input import validation_rules
+from ..utils import converters
+
+
+def test_today_results_are_not_cached_across_days(monkeypatch):
+    """A 'today' valuation date is re-resolved on every call"""
+    real_today = datetime.date.today()
+    tomorrow = real_today + datetime.timedelta(days=1)
+    params = {
+        'valuation_date': 'today',
+        'end_date': tomorrow.strftime('%d/%m/%Y'),
+    }
+    end_date_error = validation_rules.VALIDATION_MESSAGES.get('end_date_future')
+
+    assert end_date_error not in validation_rules.validate_comprehensive_phase1(params)['errors']
+
+    class _Tomorrow(datetime.date):
+        @classmethod
+        def today(cls):
+            return tomorrow
+
+    monkeypatch.setattr(converters, 'date', _Tomorrow)
+    assert end_date_error in validation_rules.validate_comprehensive_phase1(params)['errors']
+
+
+def test_parse_date_today_is_not_memoized(monkeypatch):
+    """_parse_date('today') follows the clock; other strings are memoized"""
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    assert validation_rules._parse_date('today') == (datetime.date.today(), None)
+
+    class _Tomorrow(datetime.date):
+        @classmethod
+        def today(cls):
+            return tomorrow
+
+    monkeypatch.setattr(converters, 'date', _Tomorrow)
+    assert validation_rules._parse_date('today') == (tomorrow, None)
+    assert validation_rules._parse_date('TODAY') == (tomorrow, None)
+
+    validation_rules._convert_str.cache_clear()
+    validation_rules._parse_date('01/02/2024')
+    validation_rules._parse_date('01/02/2024')
+    assert validation_rules._convert_str.cache_info().hits == 1
@@ -7,7 +7,7 @@ from typing import Dict, Any
 
 from ..core.engine import EnhancedParameterWorkflow
 from ..config.settings import WorkflowConfig, WorkflowStatus
-from ..workflows.implementations import PHASE_DEFINITIONS
+from ..workflows import PHASE_DEFINITIONS
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +90,9 @@ from .converters import (
     ValidationHelper
 )
 
+# Import schema helpers
+from .schema import field_examples_hook
+
 __all__ = [
     # Validators
     "validate_date_format",
@@ -166,7 +169,10 @@ __all__ = [
     "DataTypeConverter",
     "DisplayFormatter", 
     "Phase1DataConverter",
-    "ValidationHelper"
+    "ValidationHelper",
+    
+    # Schema helpers
+    "field_examples_hook"
 ]
 
 # Convenience functions for common operations
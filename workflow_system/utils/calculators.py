@@ -9,8 +9,27 @@ from datetime import date, datetime
 import math
 
 
-def calculate_data_quality_score(data: Dict[str, Any], core_fields: list = None) -> int:
-    """Enhanced data quality score calculation with weighted scoring"""
+# String values treated as "not provided" once normalised
+_MISSING_STRS = frozenset(("", "not specified", "none", "null"))
+
+
+def _is_filled(value: Any) -> bool:
+    """Check whether a value counts as provided (only strings need normalising)"""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() not in _MISSING_STRS
+    return True
+
+
+def calculate_data_quality_score(data: Dict[str, Any], core_fields: list = None,
+                                 core_completed: Optional[int] = None) -> int:
+    """
+    Enhanced data quality score calculation with weighted scoring
+    
+    Callers that already know how many core fields are completed can pass
+    core_completed to skip re-scanning them.
+    """
     if not data:
         return 0
     
@@ -19,19 +38,12 @@ def calculate_data_quality_score(data: Dict[str, Any], core_fields: list = None)
         return 0
     
     # Count completed fields (non-null, non-empty, not "Not specified")
-    completed_fields = len([
-        v for v in data.values() 
-        if v is not None and 
-        str(v).strip().lower() not in ["", "not specified", "none", "null"]
-    ])
+    completed_fields = sum(1 for v in data.values() if _is_filled(v))
     
     if core_fields:
         # Core fields have higher weight (70%), optional fields have lower weight (30%)
-        core_completed = sum(
-            1 for field in core_fields 
-            if data.get(field) is not None and 
-            str(data.get(field, "")).strip().lower() not in ["", "not specified", "none", "null"]
-        )
+        if core_completed is None:
+            core_completed = sum(1 for field in core_fields if _is_filled(data.get(field)))
         
         core_fields_count = len(core_fields)
         if core_fields_count == 0:
@@ -64,8 +76,7 @@ def calculate_completion_percentage(data: Dict[str, Any], required_fields: List[
     
     completed_count = 0
     for field in fields_to_check:
-        value = data.get(field)
-        if value is not None and str(value).strip().lower() not in ["", "not specified", "none", "null"]:
+        if _is_filled(data.get(field)):
             completed_count += 1
     
     percentage = (completed_count / len(fields_to_check)) * 100
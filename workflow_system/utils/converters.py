@@ -7,7 +7,7 @@ import re
 import json
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional, Dict, List, Union
+from typing import Any, Optional, Dict, List, Tuple, Union
 from workflow_system.phases.phase1_financial_input.constants import (
     ProductType, InvestmentTermType, TaxBand, AnalysisMode,
     TAX_RATES, SystemLimits
@@ -312,6 +312,18 @@ class Phase1DataConverter:
         """Get only display values"""
         converted = self.convert_all_fields(raw_data)
         return {field: display_value for field, (_, display_value) in converted.items()}
+    
+    def get_database_and_display_values(self, raw_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Get database and display values from a single conversion pass
+        Returns: (database_values, display_values)
+        """
+        database_values = {}
+        display_values = {}
+        for field_name, (db_value, display_value) in self.convert_all_fields(raw_data).items():
+            database_values[field_name] = db_value
+            display_values[field_name] = display_value
+        return database_values, display_values
 
 
 # Validation helpers
@@ -0,0 +1,25 @@
+"""
+JSON schema helpers shared by the phase parameter models
+File: workflow_system/utils/schema.py
+"""
+
+from typing import Callable, Dict, Sequence
+
+
+def field_examples_hook(examples: Dict[str, Sequence[str]]) -> Callable[[dict], None]:
+    """
+    Build a json_schema_extra hook that adds per-field example inputs
+    
+    Args:
+        examples: Field name -> example inputs (kept as shared tuples)
+        
+    Returns:
+        Hook that sets each listed property's 'examples' on a generated schema
+    """
+    def add_field_examples(schema: dict) -> None:
+        for field, prop in schema.get('properties', {}).items():
+            field_examples = examples.get(field)
+            if field_examples:
+                prop['examples'] = list(field_examples)
+    
+    return add_field_examples